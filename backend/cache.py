@@ -0,0 +1,154 @@
+"""Process-local caches for hot, rarely-changing reads.
+
+Like the rate limiter and metrics, these assume a single-process deployment
+(see ``backend.main``): a second worker would never see the other's writes.
+"""
+
+import sqlite3
+from threading import Lock
+from typing import Any
+
+
+class SettingsCache:
+    """Write-through copy of the ``settings`` table.
+
+    Loaded lazily on first read. A version counter guards the load: a reader
+    that raced a concurrent ``set()`` discards its now-stale snapshot instead of
+    overwriting the newer value.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache; the first read loads it from the database."""
+        self._values: dict[str, str] | None = None
+        self._version: int = 0
+        self._lock: Lock = Lock()
+
+    def get_all(self, db: sqlite3.Connection) -> dict[str, str]:
+        """Return a copy of every setting, loading from ``db`` on a cold cache."""
+        values: dict[str, str] | None = self._values
+        if values is None:
+            values = self._load(db)
+        return dict(values)
+
+    def get(self, db: sqlite3.Connection, key: str, default: str) -> str:
+        """Return one setting, falling back to ``default`` when it is unset."""
+        values: dict[str, str] | None = self._values
+        if values is None:
+            values = self._load(db)
+        return values.get(key, default)
+
+    def set(self, key: str, value: str) -> None:
+        """Record a committed write so subsequent reads see it without a query."""
+        with self._lock:
+            self._version += 1
+            if self._values is not None:
+                self._values = {**self._values, key: value}
+
+    def clear(self) -> None:
+        """Drop the cached values; the next read reloads them."""
+        with self._lock:
+            self._version += 1
+            self._values = None
+
+    def _load(self, db: sqlite3.Connection) -> dict[str, str]:
+        """Read the settings table and publish it unless a write raced the read."""
+        with self._lock:
+            version: int = self._version
+        rows: list[sqlite3.Row] = db.execute("SELECT key, value FROM settings").fetchall()
+        values: dict[str, str] = {row[0]: row[1] for row in rows}
+        with self._lock:
+            if self._version == version:
+                self._values = values
+        return values
+
+
+class ListSortCache:
+    """Per-list ``item_sort`` values for live lists, read on every item listing.
+
+    Only found lists are cached, so a missing or deleted list always falls
+    through to the database. Writers call ``invalidate``/``clear`` *after*
+    committing; like ``SettingsCache``, a version counter stops a reader that
+    raced the write from caching the value it read before the commit.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Create an empty cache holding at most ``maxsize`` lists."""
+        self._values: dict[str, str] = {}
+        self._maxsize: int = maxsize
+        self._version: int = 0
+        self._lock: Lock = Lock()
+
+    def get(self, db: sqlite3.Connection, list_id: str) -> str | None:
+        """Return the list's item sort, or ``None`` when it is missing or deleted."""
+        item_sort: str | None = self._values.get(list_id)
+        if item_sort is not None:
+            return item_sort
+        with self._lock:
+            version: int = self._version
+        row: sqlite3.Row | None = db.execute(
+            "SELECT item_sort FROM lists WHERE id = ? AND _deleted = 0", (list_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        item_sort = row[0] or "alphabetical"
+        with self._lock:
+            if self._version == version:
+                if len(self._values) >= self._maxsize:
+                    # Evict the oldest entry; dicts iterate in insertion order.
+                    del self._values[next(iter(self._values))]
+                self._values[list_id] = item_sort
+        return item_sort
+
+    def invalidate(self, list_id: str) -> None:
+        """Forget one list after a committed write to its sort or deletion state."""
+        with self._lock:
+            self._version += 1
+            self._values.pop(list_id, None)
+
+    def clear(self) -> None:
+        """Forget every list (e.g. after a sync push touched an unknown set)."""
+        with self._lock:
+            self._version += 1
+            self._values = {}
+
+
+class ResultCache:
+    """One memoized endpoint result, dropped whenever its inputs change.
+
+    Readers take ``version()`` *before* querying and pass it to ``store()``; a
+    write that invalidated in between bumps the version, so the reader's
+    possibly pre-write result is returned to it but never cached.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty cache."""
+        self._value: Any = None
+        self._version: int = 0
+        self._lock: Lock = Lock()
+
+    def version(self) -> int:
+        """Return the version a reader must hand back to ``store()``."""
+        return self._version
+
+    def get(self) -> Any:
+        """Return the cached result, or ``None`` on a miss."""
+        return self._value
+
+    def store(self, version: int, value: Any) -> None:
+        """Cache ``value`` unless an invalidation happened since ``version``."""
+        with self._lock:
+            if self._version == version:
+                self._value = value
+
+    def invalidate(self) -> None:
+        """Drop the cached result after a committed write to its inputs."""
+        with self._lock:
+            self._version += 1
+            self._value = None
+
+
+settings_cache: SettingsCache = SettingsCache()
+list_sort_cache: ListSortCache = ListSortCache()
+# get_lists' aggregate over every list and item; depends on lists, items, and
+# the list_sort setting.
+lists_result_cache: ResultCache = ResultCache()
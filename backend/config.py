@@ -16,6 +16,14 @@ def _env_int(name: str, default: int) -> int:
 APP_VERSION: str = "2.0.0"
 
 DATABASE: str = os.getenv("TICKR_DATABASE", "data/tickr.db")
+# Long-lived SQLite connections shared by request handlers. Writes serialize in
+# SQLite regardless, so this mainly bounds concurrent readers.
+DB_POOL_SIZE: int = _env_int("TICKR_DB_POOL_SIZE", 8)
+# Worker threads that run the sync route handlers and Starlette's file I/O
+# (AnyIO's default is 40). Independent of DB_POOL_SIZE: requests wait for a
+# pooled connection on the event loop, not in a worker thread, so raising this
+# lets non-database work proceed while others queue for a connection.
+THREADPOOL_SIZE: int = _env_int("TICKR_THREADPOOL_SIZE", 40)
 
 LOG_LEVEL: str = os.getenv("TICKR_LOG_LEVEL", "INFO")
 
@@ -1,11 +1,15 @@
 """Database connection, initialization, and migration logic."""
 
+import asyncio
+import queue
 import sqlite3
 import uuid
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
-from typing import Final
+from typing import Any, Final
 
 from backend.config import DATABASE
 from backend.logging_config import get_logger
@@ -13,7 +17,7 @@ from backend.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-_SCHEMA_SQL: Final[str] = """
+_TABLES_SQL: Final[str] = """
 CREATE TABLE IF NOT EXISTS lists (
     id TEXT PRIMARY KEY,
     name TEXT NOT NULL,
@@ -66,25 +70,211 @@ CREATE TABLE IF NOT EXISTS settings (
     value TEXT NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_items_list_id ON items(list_id, _deleted);
-CREATE INDEX IF NOT EXISTS idx_items_updated ON items(updated_at, id);
-CREATE INDEX IF NOT EXISTS idx_lists_updated ON lists(updated_at, id);
-CREATE INDEX IF NOT EXISTS idx_categories_list_id ON categories(list_id, _deleted);
-CREATE INDEX IF NOT EXISTS idx_categories_updated ON categories(updated_at, id);
-CREATE INDEX IF NOT EXISTS idx_history_list_id ON history(list_id, hidden, timestamp);
 """
 
+# Hot-path indexes, defined once: fresh schemas get them through _SCHEMA_SQL and
+# existing databases through _ensure_indexes.
+_INDEX_DDL: Final[tuple[str, ...]] = (
+    "CREATE INDEX IF NOT EXISTS idx_items_list_sort "
+    "ON items(list_id, _deleted, completed, text COLLATE NOCASE)",
+    "CREATE INDEX IF NOT EXISTS idx_items_updated ON items(updated_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_lists_updated ON lists(updated_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_categories_list_id ON categories(list_id, _deleted)",
+    "CREATE INDEX IF NOT EXISTS idx_categories_updated ON categories(updated_at, id)",
+    "CREATE INDEX IF NOT EXISTS idx_history_list_id ON history(list_id, hidden, timestamp)",
+)
+
+_SCHEMA_SQL: Final[str] = _TABLES_SQL + "".join(f"{statement};\n" for statement in _INDEX_DDL)
+
+# Live item totals per list, kept current by triggers so get_lists reads two
+# integers per list instead of aggregating every item. They live in their own
+# table rather than on ``lists`` because sync pulls ``SELECT *`` from lists and
+# compares every column against the client's state. An item's contribution is
+# (1, completed IS 1) while ``_deleted = 0``, else nothing; the update trigger
+# removes the old row's contribution and adds the new one. ``IS`` rather than
+# ``=`` because ``completed`` is nullable (sync may push null) and a NULL
+# contribution would violate the NOT NULL counts. Separate statements
+# (not one script) so they can run inside init_db's open transaction.
+_LIST_COUNTS_DDL: Final[tuple[str, ...]] = (
+    """
+    CREATE TABLE IF NOT EXISTS list_counts (
+        list_id TEXT PRIMARY KEY,
+        total_items INTEGER NOT NULL DEFAULT 0,
+        completed_items INTEGER NOT NULL DEFAULT 0,
+        FOREIGN KEY (list_id) REFERENCES lists(id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_list_counts_insert AFTER INSERT ON items
+    WHEN NEW._deleted = 0
+    BEGIN
+        INSERT INTO list_counts (list_id, total_items, completed_items)
+        VALUES (NEW.list_id, 1, NEW.completed IS 1)
+        ON CONFLICT (list_id) DO UPDATE SET
+            total_items = total_items + 1,
+            completed_items = completed_items + excluded.completed_items;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_list_counts_delete AFTER DELETE ON items
+    WHEN OLD._deleted = 0
+    BEGIN
+        UPDATE list_counts SET
+            total_items = total_items - 1,
+            completed_items = completed_items - (OLD.completed IS 1)
+        WHERE list_id = OLD.list_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_list_counts_update
+    AFTER UPDATE OF list_id, completed, _deleted ON items
+    BEGIN
+        UPDATE list_counts SET
+            total_items = total_items - 1,
+            completed_items = completed_items - (OLD.completed IS 1)
+        WHERE list_id = OLD.list_id AND OLD._deleted = 0;
+        INSERT INTO list_counts (list_id, total_items, completed_items)
+        SELECT NEW.list_id, 1, NEW.completed IS 1 WHERE NEW._deleted = 0
+        ON CONFLICT (list_id) DO UPDATE SET
+            total_items = total_items + 1,
+            completed_items = completed_items + excluded.completed_items;
+    END
+    """,
+)
+
+
+# Per-connection settings; unlike ``journal_mode=WAL`` (persisted in the file by
+# ``init_db``) these reset on every open. ``synchronous=NORMAL`` is safe under WAL:
+# a power loss can drop the last commits but never corrupts the database.
+_TUNING_PRAGMAS: Final[tuple[str, ...]] = (
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+)
+
+# Prepared statements kept per pooled connection. Every route runs a fixed set of
+# module-level SQL strings (one per sort option, partial-update shape and sync
+# collection), close to a hundred in all; sqlite3's default of 128 would start
+# evicting, and re-parsing, under a mixed workload.
+_STATEMENT_CACHE_SIZE: Final[int] = 256
+
+
+def configure_connection(conn: sqlite3.Connection, *, foreign_keys: bool = True) -> None:
+    """Apply the per-connection performance PRAGMAs and, by default, enforce foreign keys.
+
+    ``init_db`` opts out of foreign keys: its table rebuilds drop and recreate
+    parent tables, which would cascade-delete child rows if they were enforced.
+    """
+    if foreign_keys:
+        conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in _TUNING_PRAGMAS:
+        conn.execute(pragma)
+
+
+class ConnectionPool:
+    """Fixed set of long-lived, pre-configured connections shared by all requests.
+
+    Reusing connections keeps SQLite's per-connection page cache warm and skips
+    the open + PRAGMA setup that a fresh connection pays on every request. Idle
+    connections are handed out last-in, first-out: under light load the same
+    one or two connections serve every request, so their caches stay hottest,
+    while the rest only wake up for concurrency bursts.
+
+    Requests borrow through ``connection()``, which waits for a free slot on the
+    event loop. Sync dependencies and handlers share AnyIO's worker-thread
+    limiter, so a request parked in a worker thread waiting for a connection
+    would hold the thread that a request already holding a connection needs to
+    finish and release it; a burst larger than the pool would then deadlock.
+    """
 
-def get_db() -> Iterator[sqlite3.Connection]:
-    """Yield a database connection for dependency injection."""
-    conn: sqlite3.Connection = sqlite3.connect(DATABASE, check_same_thread=False)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA busy_timeout = 5000")
-    try:
+    def __init__(self) -> None:
+        """Create an empty pool; call ``open()`` before the first ``acquire()``."""
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._connections: list[sqlite3.Connection] = []
+        self._slots: asyncio.Semaphore = asyncio.Semaphore(0)
+        self._closed: bool = False
+
+    def open(self, database: str, size: int) -> None:
+        """Open ``size`` connections to ``database`` and make them available."""
+        self._closed = False
+        self._slots = asyncio.Semaphore(size)
+        for _ in range(size):
+            conn: sqlite3.Connection = sqlite3.connect(
+                database, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+            )
+            conn.row_factory = sqlite3.Row
+            configure_connection(conn)
+            self._connections.append(conn)
+            self._idle.put(conn)
+        logger.info("db_pool_opened", size=size)
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[sqlite3.Connection]:
+        """Borrow a connection for the block, waiting on the event loop until one is free."""
+        async with self._slots:
+            conn: sqlite3.Connection = self.acquire()
+            try:
+                yield conn
+            finally:
+                self.release(conn)
+
+    def acquire(self) -> sqlite3.Connection:
+        """Borrow an idle connection without blocking.
+
+        Raises ``RuntimeError`` when the pool is closed or has no idle
+        connection; a slot held through ``connection()`` guarantees one.
+        """
+        if self._closed or not self._connections:
+            raise RuntimeError("Connection pool is not open")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            raise RuntimeError("Connection pool is exhausted") from None
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a borrowed connection to the pool.
+
+        A handler that raised mid-write leaves its implicit transaction open;
+        it is rolled back so the next borrower starts from a clean state. A
+        connection released after ``close()`` (a handler still in flight at
+        shutdown), or borrowed before a reopen, is closed instead of re-queued.
+        """
+        if self._closed or conn not in self._connections:
+            conn.close()
+            return
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    def close(self) -> None:
+        """Close the pool at shutdown.
+
+        Idle connections close now; borrowed ones are left to their handlers
+        and closed by ``release()``.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        self._connections.clear()
+        logger.info("db_pool_closed")
+
+
+connection_pool: ConnectionPool = ConnectionPool()
+
+
+async def get_db() -> AsyncIterator[sqlite3.Connection]:
+    """Yield a pooled database connection for dependency injection.
+
+    Async so that waiting for a connection happens on the event loop (see
+    ``ConnectionPool``); the sync handlers using it still run in worker threads.
+    """
+    async with connection_pool.connection() as conn:
         yield conn
-    finally:
-        conn.close()
 
 
 def now() -> str:
@@ -97,6 +287,44 @@ def new_uuid() -> str:
     return str(uuid.uuid4())
 
 
+def fetch_dicts(
+    conn: sqlite3.Connection, sql: str, params: Sequence[Any] = ()
+) -> list[dict[str, Any]]:
+    """Run a read query and return every row as a plain dict.
+
+    The cursor fetches plain tuples and each dict is zipped from one shared key
+    tuple, which skips the per-row ``sqlite3.Row`` construction and per-column
+    name lookup that ``dict(row)`` pays on large result sets. Iterating the
+    cursor (rather than ``fetchall()``) steps SQLite one row at a time, so the
+    tuples are never all held alongside the dicts built from them.
+    """
+    cursor: sqlite3.Cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(sql, params)
+    keys: tuple[str, ...] = tuple(column[0] for column in cursor.description)
+    return [dict(zip(keys, row, strict=True)) for row in cursor]
+
+
+@cache
+def update_by_id_sql(table: str, columns: tuple[str, ...]) -> str:
+    """Return ``UPDATE <table> SET <col> = ?, ... WHERE id = ?`` for ``columns``.
+
+    Partial-update handlers write one of a handful of column combinations, so
+    each statement is built once per shape and then reused. ``table`` and
+    ``columns`` must come from code, never from request data.
+    """
+    assignments: str = ", ".join(f"{column} = ?" for column in columns)
+    return f"UPDATE {table} SET {assignments} WHERE id = ?"
+
+
+# (list_id, item_id, action, item_text) in the column order of ``_HISTORY_INSERT_SQL``.
+HistoryEntry = tuple[str | None, str | None, str, str | None]
+
+_HISTORY_INSERT_SQL: Final[str] = (
+    "INSERT INTO history (list_id, item_id, action, item_text) VALUES (?, ?, ?, ?)"
+)
+
+
 def log_history(
     cursor: sqlite3.Cursor,
     list_id: str | None,
@@ -105,10 +333,13 @@ def log_history(
     item_id: str | None = None,
 ) -> None:
     """Insert a single history entry; ``item_id`` is NULL for list-level actions."""
-    cursor.execute(
-        "INSERT INTO history (list_id, item_id, action, item_text) VALUES (?, ?, ?, ?)",
-        (list_id, item_id, action, item_text),
-    )
+    cursor.execute(_HISTORY_INSERT_SQL, (list_id, item_id, action, item_text))
+
+
+def log_history_entries(cursor: sqlite3.Cursor, entries: Sequence[HistoryEntry]) -> None:
+    """Insert several history entries with a single prepared statement."""
+    if entries:
+        cursor.executemany(_HISTORY_INSERT_SQL, entries)
 
 
 def init_db(conn: sqlite3.Connection | None = None) -> None:
@@ -122,6 +353,7 @@ def init_db(conn: sqlite3.Connection | None = None) -> None:
     """
     if conn is not None:
         conn.executescript(_SCHEMA_SQL)
+        _ensure_list_counts(conn)
         conn.execute(
             "INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)",
             ("list_sort", "alphabetical"),
@@ -133,8 +365,28 @@ def init_db(conn: sqlite3.Connection | None = None) -> None:
     Path(DATABASE).parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(DATABASE)
     conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout = 5000")
+    # Same tuning as the pooled connections: the large cache speeds up table
+    # rebuilds, and synchronous=NORMAL makes the single bootstrap commit cheap.
+    configure_connection(conn, foreign_keys=False)
     logger.info("db_wal_enabled")
+    # The whole bootstrap runs as one transaction: a single commit (and fsync)
+    # instead of one per step, and a failed migration leaves the file as it was.
+    # BEGIN is explicit because sqlite3 only opens transactions before DML, so
+    # CREATE/ALTER/DROP would otherwise each autocommit.
+    try:
+        with conn:
+            conn.execute("BEGIN")
+            _bootstrap_schema(conn)
+        # Refresh planner statistics for new or changed indexes; a cheap no-op
+        # when nothing has changed since the last run.
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+    logger.info("db_init_complete")
+
+
+def _bootstrap_schema(conn: sqlite3.Connection) -> None:
+    """Create or migrate the schema and seed defaults inside the caller's transaction."""
     cursor: sqlite3.Cursor = conn.cursor()
 
     # Check if migration from INTEGER to TEXT PKs is needed
@@ -155,6 +407,7 @@ def init_db(conn: sqlite3.Connection | None = None) -> None:
     _ensure_history_hidden_column(conn)
     _ensure_history_item_fk(conn)
     _ensure_indexes(conn)
+    _ensure_list_counts(conn)
 
     # Settings table
     cursor.execute("PRAGMA table_info(settings)")
@@ -186,15 +439,14 @@ def init_db(conn: sqlite3.Connection | None = None) -> None:
             (list_id, "Todos", "check", "alphabetical", 0, timestamp, timestamp),
         )
 
-    conn.commit()
-    conn.close()
-    logger.info("db_init_complete")
-
 
 def _create_tables_fresh(conn: sqlite3.Connection) -> None:
     """Create all tables and indexes with UUID TEXT primary keys from scratch."""
-    conn.executescript(_SCHEMA_SQL)
-    conn.commit()
+    # Statement by statement rather than executescript(), which would commit
+    # init_db's open transaction first. The schema has no literal semicolons.
+    for statement in _SCHEMA_SQL.split(";"):
+        if statement.strip():
+            conn.execute(statement)
 
 
 def _migrate_to_uuid(conn: sqlite3.Connection) -> None:
@@ -312,7 +564,6 @@ def _migrate_to_uuid(conn: sqlite3.Connection) -> None:
     cursor.execute("ALTER TABLE items_new RENAME TO items")
     cursor.execute("ALTER TABLE history_new RENAME TO history")
 
-    conn.commit()
     logger.info(
         "db_migration_complete",
         migration="integer_pk_to_uuid",
@@ -364,8 +615,6 @@ def _ensure_columns(conn: sqlite3.Connection) -> None:
             )
         """)
 
-    conn.commit()
-
 
 def _rename_legacy_history_actions(conn: sqlite3.Connection) -> None:
     """Rename legacy ``item_edited`` history rows to ``item_renamed``.
@@ -378,7 +627,6 @@ def _rename_legacy_history_actions(conn: sqlite3.Connection) -> None:
         logger.info(
             "history_action_renamed", rows=cursor.rowcount, old="item_edited", new="item_renamed"
         )
-    conn.commit()
 
 
 def _ensure_history_hidden_column(conn: sqlite3.Connection) -> None:
@@ -393,7 +641,6 @@ def _ensure_history_hidden_column(conn: sqlite3.Connection) -> None:
     if "hidden" not in history_cols:
         cursor.execute("ALTER TABLE history ADD COLUMN hidden INTEGER DEFAULT 0")
         logger.info("history_hidden_column_added")
-    conn.commit()
 
 
 def _ensure_history_item_fk(conn: sqlite3.Connection) -> None:
@@ -424,7 +671,10 @@ def _ensure_history_item_fk(conn: sqlite3.Connection) -> None:
 
     # SQLite has transactional DDL, so a failure mid-rebuild can be rolled back to
     # the intact original table instead of leaving the database without history.
+    # A savepoint scopes that rollback to the rebuild alone, whether or not the
+    # caller (init_db) already holds an enclosing transaction.
     logger.info("db_migration_begin", migration="history_item_fk")
+    cursor.execute("SAVEPOINT history_item_fk")
     try:
         cursor.execute("DROP TABLE IF EXISTS history_new")
         cursor.execute("""
@@ -446,9 +696,10 @@ def _ensure_history_item_fk(conn: sqlite3.Connection) -> None:
         migrated: int = cursor.rowcount
         cursor.execute("DROP TABLE IF EXISTS history")
         cursor.execute("ALTER TABLE history_new RENAME TO history")
-        conn.commit()
+        cursor.execute("RELEASE history_item_fk")
     except Exception:
-        conn.rollback()
+        cursor.execute("ROLLBACK TO history_item_fk")
+        cursor.execute("RELEASE history_item_fk")
         logger.exception("db_migration_failed", migration="history_item_fk")
         raise
     logger.info("db_migration_complete", migration="history_item_fk", rows=migrated)
@@ -457,16 +708,31 @@ def _ensure_history_item_fk(conn: sqlite3.Connection) -> None:
 def _ensure_indexes(conn: sqlite3.Connection) -> None:
     """Create indexes on sync hot paths. Idempotent — safe to call repeatedly."""
     cursor: sqlite3.Cursor = conn.cursor()
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_list_id ON items(list_id, _deleted)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_items_updated ON items(updated_at, id)")
-    cursor.execute("CREATE INDEX IF NOT EXISTS idx_lists_updated ON lists(updated_at, id)")
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_categories_list_id ON categories(list_id, _deleted)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_categories_updated ON categories(updated_at, id)"
-    )
-    cursor.execute(
-        "CREATE INDEX IF NOT EXISTS idx_history_list_id ON history(list_id, hidden, timestamp)"
+    # Both superseded by idx_items_list_sort: its (list_id, _deleted, completed)
+    # prefix serves get_items' filters, and the trailing NOCASE text column
+    # hands it the default alphabetical order without a temp B-tree sort.
+    cursor.execute("DROP INDEX IF EXISTS idx_items_list_id")
+    cursor.execute("DROP INDEX IF EXISTS idx_items_list_completed")
+    for statement in _INDEX_DDL:
+        cursor.execute(statement)
+
+
+def _ensure_list_counts(conn: sqlite3.Connection) -> None:
+    """Create the ``list_counts`` table and triggers, then rebuild the counts.
+
+    The rebuild is one grouped pass over ``items`` per startup; it backfills
+    databases that predate the triggers and heals any drift (e.g. after a
+    restore) at no cost on the request path.
+    """
+    # Recreate the triggers so databases carrying an older definition pick up
+    # fixes; CREATE TRIGGER IF NOT EXISTS alone would keep the stale one.
+    for trigger in ("trg_list_counts_insert", "trg_list_counts_delete", "trg_list_counts_update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    for statement in _LIST_COUNTS_DDL:
+        conn.execute(statement)
+    conn.execute("DELETE FROM list_counts")
+    conn.execute(
+        "INSERT INTO list_counts (list_id, total_items, completed_items) "
+        "SELECT list_id, COUNT(*), SUM(completed IS 1) FROM items "
+        "WHERE _deleted = 0 AND list_id IN (SELECT id FROM lists) GROUP BY list_id"
     )
-    conn.commit()
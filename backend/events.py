@@ -12,9 +12,11 @@ import json
 import time
 from collections.abc import AsyncIterator
 from contextlib import suppress
+from functools import cache, lru_cache
 
 from fastapi import BackgroundTasks
 
+from .cache import lists_result_cache
 from .config import MAX_SSE_CLIENTS, SSE_HEARTBEAT_INTERVAL
 from .errors import AppError, ErrorCode
 from .logging_config import get_logger
@@ -25,6 +27,20 @@ logger = get_logger(__name__)
 shutdown_event: asyncio.Event = asyncio.Event()
 
 
+def _drain_unique(queue: asyncio.Queue[str], first: str) -> list[str]:
+    """Collect ``first`` plus everything already queued, minus duplicates.
+
+    A burst of writes (e.g. rapid edits within one list) enqueues the same
+    ``items_changed`` notification repeatedly; sending each distinct message
+    once, in one chunk, costs a single write/flush per burst. Clients still
+    receive one SSE event per message, so the wire format is unchanged.
+    """
+    messages: dict[str, None] = {first: None}
+    while not queue.empty():
+        messages[queue.get_nowait()] = None
+    return list(messages)
+
+
 class SseBroadcaster:
     """Owns a pool of SSE client queues plus the shared event generator."""
 
@@ -33,8 +49,12 @@ class SseBroadcaster:
         self._name = name
         self._max_clients = max_clients
         self._queue_size = queue_size
-        self._clients: set[asyncio.Queue[str]] = set()
+        # Copy-on-write: register/unregister (loop thread only) swap in a new
+        # frozenset, so broadcast() can iterate the current reference from any
+        # thread without a lock or a defensive copy.
+        self._clients: frozenset[asyncio.Queue[str]] = frozenset()
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._drained: asyncio.Event | None = None
         # Lifetime metrics for the observability dashboard.
         self._events_sent: int = 0
         self._connections_opened: int = 0
@@ -71,7 +91,7 @@ class SseBroadcaster:
             )
             raise AppError(ErrorCode.TOO_MANY_CONNECTIONS, "Too many SSE connections", 429)
         queue: asyncio.Queue[str] = asyncio.Queue(maxsize=self._queue_size)
-        self._clients.add(queue)
+        self._clients = self._clients | {queue}
         self._connections_opened += 1
         self._connected_at[queue] = time.monotonic()
         logger.info("sse_client_connected", broadcaster=self._name, active=len(self._clients))
@@ -79,33 +99,52 @@ class SseBroadcaster:
 
     async def unregister(self, queue: asyncio.Queue[str]) -> None:
         """Remove a client queue from the active set."""
-        self._clients.discard(queue)
+        self._clients = self._clients - {queue}
         opened_at: float | None = self._connected_at.pop(queue, None)
         if opened_at is not None:
             self._duration_sum += time.monotonic() - opened_at
         logger.info("sse_client_disconnected", broadcaster=self._name, active=len(self._clients))
+        if not self._clients and self._drained is not None:
+            self._drained.set()
+            self._drained = None
+
+    async def wait_until_empty(self) -> None:
+        """Block until every connected client has unregistered."""
+        if not self._clients:
+            return
+        if self._drained is None:
+            self._drained = asyncio.Event()
+        await self._drained.wait()
 
     def broadcast(self, message: str) -> None:
         """Fan out a message to every client queue.
 
-        Safe to call from sync worker threads: hops onto the bound loop via
-        ``call_soon_threadsafe`` so the queues are only mutated from the loop.
-        Drops messages on ``QueueFull`` without blocking the publisher.
+        Safe to call from sync worker threads: a single ``call_soon_threadsafe``
+        hands the whole fan-out to the bound loop, so the queues are only
+        mutated from the loop and a broadcast costs one loop wake-up regardless
+        of how many clients are connected.
         """
         loop: asyncio.AbstractEventLoop | None = self._loop
         if loop is None:
             logger.debug("sse_broadcast_skipped", broadcaster=self._name, reason="no_loop_bound")
             return
-        for queue in tuple(self._clients):
-            loop.call_soon_threadsafe(self._enqueue, queue, message)
+        loop.call_soon_threadsafe(self._fan_out, message)
 
-    @staticmethod
-    def _enqueue(queue: asyncio.Queue[str], message: str) -> None:
-        """Put a message on a single client queue; drop on overflow."""
-        try:
-            queue.put_nowait(message)
-        except asyncio.QueueFull:
-            logger.warning("sse_queue_full_drop")
+    def _fan_out(self, message: str) -> None:
+        """Put a message on every client queue (loop thread); evict clients that overflow.
+
+        A full queue means the client has stopped keeping up. Silently dropping
+        the message would leave it with a stale view and no signal to resync,
+        so its queue is shut down instead: the stream ends and the client
+        reconnects, and its next pull catches up from its own checkpoint.
+        """
+        for queue in self._clients:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self._clients = self._clients - {queue}
+                queue.shutdown(immediate=True)
+                logger.warning("sse_client_evicted", broadcaster=self._name, reason="queue_full")
 
     async def stream(self, queue: asyncio.Queue[str], heartbeat: float) -> AsyncIterator[str]:
         """Yield SSE frames from the given client queue until shutdown or cancel.
@@ -123,9 +162,10 @@ class SseBroadcaster:
                     # addEventListener("heartbeat") and reset their liveness timer.
                     yield "event: heartbeat\ndata: {}\n\n"
                     continue
-                self._events_sent += 1
-                yield f"data: {data}\n\n"
-        except asyncio.CancelledError:
+                messages: list[str] = _drain_unique(queue, data)
+                self._events_sent += len(messages)
+                yield "".join(f"data: {message}\n\n" for message in messages)
+        except (asyncio.CancelledError, asyncio.QueueShutDown):
             pass
         finally:
             await self.unregister(queue)
@@ -154,20 +194,38 @@ def get_connection_counts() -> dict[str, float]:
     }
 
 
+@lru_cache(maxsize=1024)
+def _encode_update(event_type: str, list_id: str | None) -> str:
+    """Serialize a legacy SSE payload; memoized because the same few pairs recur."""
+    return json.dumps({"type": event_type, "list_id": list_id})
+
+
+@cache
+def _encode_sync(collection: str) -> str:
+    """Serialize a sync SSE payload; the set of collections is small and fixed."""
+    return json.dumps({"collection": collection})
+
+
 def broadcast_update(event_type: str, list_id: str | None = None) -> None:
     """Notify all legacy SSE clients of a data change."""
-    legacy_broadcaster.broadcast(json.dumps({"type": event_type, "list_id": list_id}))
+    legacy_broadcaster.broadcast(_encode_update(event_type, list_id))
 
 
 def broadcast_sync(collection: str) -> None:
     """Notify all sync SSE clients that a collection has changed."""
-    sync_broadcaster.broadcast(json.dumps({"collection": collection}))
+    sync_broadcaster.broadcast(_encode_sync(collection))
 
 
 def notify_change(
     bg: BackgroundTasks, event_type: str, collection: str, list_id: str | None = None
 ) -> None:
-    """Schedule the paired legacy + sync broadcasts that follow a data change."""
+    """Drop cached reads of the changed data and schedule the paired broadcasts.
+
+    Every write path calls this right after committing, which makes it the one
+    place cached reads are invalidated synchronously, before the response.
+    """
+    if collection in ("lists", "items"):
+        lists_result_cache.invalidate()
     bg.add_task(broadcast_update, event_type, list_id)
     bg.add_task(broadcast_sync, collection)
 
@@ -190,17 +248,19 @@ async def initiate_shutdown(drain_timeout: float = 2.0) -> None:
     _broadcast_shutdown_message()
     shutdown_event.set()
 
-    elapsed: float = 0.0
-    poll_interval: float = 0.1
-    while elapsed < drain_timeout:
-        legacy_count: int = legacy_broadcaster.client_count()
-        sync_count: int = sync_broadcaster.client_count()
-        if legacy_count == 0 and sync_count == 0:
-            logger.info("sse_shutdown_drained")
-            return
-        with suppress(asyncio.CancelledError):
-            await asyncio.sleep(poll_interval)
-        elapsed += poll_interval
+    # Woken by the last unregister rather than polling the client counts.
+    waiters: set[asyncio.Task[None]] = {
+        asyncio.create_task(legacy_broadcaster.wait_until_empty()),
+        asyncio.create_task(sync_broadcaster.wait_until_empty()),
+    }
+    pending: set[asyncio.Task[None]] = waiters
+    with suppress(asyncio.CancelledError):
+        _, pending = await asyncio.wait(waiters, timeout=drain_timeout)
+    for waiter in pending:
+        waiter.cancel()
+    if not pending:
+        logger.info("sse_shutdown_drained")
+        return
 
     logger.warning(
         "sse_shutdown_drain_timeout",
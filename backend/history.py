@@ -4,105 +4,141 @@ import sqlite3
 from collections.abc import Mapping
 from typing import Any
 
-from .database import log_history
+from .database import HistoryEntry, log_history_entries
 
 ARROW: str = "→"
 
 
-def log_list_diff(
-    cursor: sqlite3.Cursor,
+def list_diff_entries(
     old_row: Mapping[str, Any] | None,
     new_values: Mapping[str, Any],
     *,
     undo: bool = False,
-) -> None:
-    """Log list lifecycle events implied by the diff between old and new state.
+) -> list[HistoryEntry]:
+    """Return the list lifecycle events implied by the diff between old and new state.
 
     ``old_row`` is ``None`` for inserts. ``new_values`` must be the *complete*
     new document state. Reorder-only updates (``sort_order`` changes) are
     intentionally ignored — they reflect UI preference, not a meaningful change.
-    ``undo=True`` suppresses all logging.
+    ``undo=True`` suppresses all entries.
     """
     if undo:
-        return
+        return []
 
     if old_row is None:
         if not new_values.get("_deleted"):
-            log_history(cursor, new_values["id"], "list_created", new_values.get("name"))
-        return
+            return [(new_values["id"], None, "list_created", new_values.get("name"))]
+        return []
 
     if not old_row.get("_deleted") and new_values.get("_deleted"):
-        return
+        return []
 
     list_id: str = new_values["id"]
+    entries: list[HistoryEntry] = []
 
     old_name: str | None = old_row.get("name")
     new_name: str | None = new_values.get("name")
     if new_name is not None and old_name != new_name:
-        log_history(cursor, list_id, "list_renamed", f"{old_name} {ARROW} {new_name}")
+        entries.append((list_id, None, "list_renamed", f"{old_name} {ARROW} {new_name}"))
 
     old_icon: str | None = old_row.get("icon")
     new_icon: str | None = new_values.get("icon")
     if new_icon is not None and old_icon != new_icon:
-        log_history(cursor, list_id, "list_icon_changed", f"{old_icon} {ARROW} {new_icon}")
+        entries.append((list_id, None, "list_icon_changed", f"{old_icon} {ARROW} {new_icon}"))
 
     old_sort: str | None = old_row.get("item_sort")
     new_sort: str | None = new_values.get("item_sort")
     if new_sort is not None and old_sort != new_sort:
-        log_history(cursor, list_id, "list_sort_changed", f"{old_sort} {ARROW} {new_sort}")
+        entries.append((list_id, None, "list_sort_changed", f"{old_sort} {ARROW} {new_sort}"))
 
+    return entries
 
-def log_item_diff(
-    cursor: sqlite3.Cursor,
+
+def item_diff_entries(
     old_row: Mapping[str, Any] | None,
     new_values: Mapping[str, Any],
     *,
     undo: bool = False,
-) -> None:
-    """Log item lifecycle events implied by the diff between old and new state.
+) -> list[HistoryEntry]:
+    """Return the item lifecycle events implied by the diff between old and new state.
 
     ``old_row`` is ``None`` for inserts. ``new_values`` must be the *complete*
     new document state (callers merge partial updates onto the stored row first),
     otherwise omitted fields read as ``None`` and produce spurious diffs.
-    ``undo=True`` suppresses all logging.
+    ``undo=True`` suppresses all entries.
     """
     if undo:
-        return
+        return []
 
     list_id: str | None = new_values.get("list_id") or (old_row or {}).get("list_id")
     item_id: str = new_values["id"]
 
     if old_row is None:
         if not new_values.get("_deleted"):
-            log_history(cursor, list_id, "item_created", new_values.get("text"), item_id)
-        return
+            return [(list_id, item_id, "item_created", new_values.get("text"))]
+        return []
 
     if not old_row.get("_deleted") and new_values.get("_deleted"):
-        log_history(cursor, list_id, "item_deleted", old_row.get("text"), item_id)
-        return
+        return [(list_id, item_id, "item_deleted", old_row.get("text"))]
 
     if old_row.get("_deleted") and not new_values.get("_deleted"):
-        log_history(cursor, list_id, "item_restored", new_values.get("text"), item_id)
-        return
+        return [(list_id, item_id, "item_restored", new_values.get("text"))]
+
+    entries: list[HistoryEntry] = []
 
     old_text: str | None = old_row.get("text")
     new_text: str | None = new_values.get("text")
     if old_text != new_text:
-        log_history(cursor, list_id, "item_renamed", f"{old_text} {ARROW} {new_text}", item_id)
+        entries.append((list_id, item_id, "item_renamed", f"{old_text} {ARROW} {new_text}"))
 
     old_completed: bool = bool(old_row.get("completed"))
     new_completed: bool = bool(new_values.get("completed"))
     if old_completed != new_completed:
         action: str = "item_completed" if new_completed else "item_uncompleted"
-        log_history(cursor, list_id, action, new_text, item_id)
+        entries.append((list_id, item_id, action, new_text))
 
     old_category: str | None = old_row.get("category_id")
     new_category: str | None = new_values.get("category_id")
     if old_category != new_category:
-        log_history(
-            cursor,
-            list_id,
-            "item_category_changed",
-            f"{old_category or ''} {ARROW} {new_category or ''}",
-            item_id,
+        entries.append(
+            (
+                list_id,
+                item_id,
+                "item_category_changed",
+                f"{old_category or ''} {ARROW} {new_category or ''}",
+            )
         )
+
+    return entries
+
+
+def log_item_diff(
+    cursor: sqlite3.Cursor,
+    old_row: Mapping[str, Any] | None,
+    new_values: Mapping[str, Any],
+    *,
+    undo: bool = False,
+) -> None:
+    """Log the entries from ``item_diff_entries`` in one batched INSERT."""
+    log_history_entries(cursor, item_diff_entries(old_row, new_values, undo=undo))
+
+
+class HistoryBuffer:
+    """Collects history entries during a request and writes them in one batch.
+
+    Entries must be flushed inside the same transaction as the writes they
+    describe, so a rolled-back request never leaves orphaned history behind.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty buffer."""
+        self._entries: list[HistoryEntry] = []
+
+    def extend(self, entries: list[HistoryEntry]) -> None:
+        """Queue ``entries`` for the next ``flush``."""
+        self._entries.extend(entries)
+
+    def flush(self, cursor: sqlite3.Cursor) -> None:
+        """Insert every queued entry with one ``executemany`` and empty the buffer."""
+        log_history_entries(cursor, self._entries)
+        self._entries = []
@@ -32,6 +32,7 @@ from collections.abc import AsyncIterator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from threading import Lock
 
+import anyio.to_thread
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -43,13 +44,15 @@ from .config import (
     CORS_ORIGINS,
     CSP_CONNECT_SRC,
     DATABASE,
+    DB_POOL_SIZE,
     RATE_LIMIT_MAX_IPS,
     RATE_LIMIT_REQUESTS,
     RATE_LIMIT_WINDOW,
+    THREADPOOL_SIZE,
     TOMBSTONE_PURGE_INTERVAL_HOURS,
     TOMBSTONE_RETAIN_DAYS,
 )
-from .database import init_db
+from .database import configure_connection, connection_pool, init_db
 from .errors import ErrorCode, _error_body, register_error_handlers
 from .events import bind_loop, initiate_shutdown
 from .logging_config import configure_logging, get_logger
@@ -77,9 +80,17 @@ async def _sample_event_loop_lag() -> None:
 
 
 def _run_purge() -> int:
-    """Open a short-lived connection and purge expired tombstones (blocking)."""
+    """Open a short-lived connection and purge expired tombstones (blocking).
+
+    The connection is its own rather than a pooled one, so the purge never
+    competes with requests for a slot or outlives the pool at shutdown. It gets
+    the pool's tuning, notably ``busy_timeout``: a purge that overlaps a
+    request's write waits for the lock instead of failing with "database is
+    locked".
+    """
     conn: sqlite3.Connection = sqlite3.connect(DATABASE)
     try:
+        configure_connection(conn)
         return purge_tombstones(conn, TOMBSTONE_RETAIN_DAYS)
     finally:
         conn.close()
@@ -104,9 +115,13 @@ async def _purge_tombstones_loop() -> None:
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
-    """Initialize database on startup."""
+    """Initialize the database and connection pool on startup."""
     logger.info("app_startup_begin")
     init_db()
+    connection_pool.open(DATABASE, DB_POOL_SIZE)
+    # Sync ``def`` handlers run on AnyIO's shared thread limiter; size it here
+    # since it is created per event loop and cannot be configured up front.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
     bind_loop(asyncio.get_running_loop())
     lag_task: asyncio.Task[None] = asyncio.create_task(_sample_event_loop_lag())
     purge_task: asyncio.Task[None] = asyncio.create_task(_purge_tombstones_loop())
@@ -120,6 +135,7 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     lag_task.cancel()
     purge_task.cancel()
     await initiate_shutdown()
+    connection_pool.close()
 
 
 app: FastAPI = FastAPI(
@@ -220,23 +220,6 @@ class SuccessResponse(BaseModel):
     success: bool = True
 
 
-# Valid sort options for items
-VALID_SORT_OPTIONS: list[str] = [
-    "alphabetical",
-    "alphabetical_desc",
-    "created_desc",
-    "created_asc",
-]
-
-# Valid sort options for lists
-VALID_LIST_SORT_OPTIONS: list[str] = [
-    "alphabetical",
-    "alphabetical_desc",
-    "created_desc",
-    "created_asc",
-    "custom",
-]
-
 # Sort option to SQL ORDER BY mapping for items
 SORT_SQL: dict[str, str] = {
     "alphabetical": "text COLLATE NOCASE ASC",
@@ -254,11 +237,18 @@ LIST_SORT_SQL: dict[str, str] = {
     "custom": "l.sort_order, l.created_at",
 }
 
+# Valid sort options, derived from the SQL maps so validation can never accept an
+# option the queries don't know (or reject one they do). Iterate the maps, not
+# these sets, where a stable order matters.
+VALID_SORT_OPTIONS: frozenset[str] = frozenset(SORT_SQL)
+VALID_LIST_SORT_OPTIONS: frozenset[str] = frozenset(LIST_SORT_SQL)
+
 
 def resolve_sort_sql(option: str | None, mapping: dict[str, str]) -> str:
-    """Return the ORDER BY clause for ``option``, falling back to alphabetical.
+    """Return the SQL ``mapping`` holds for ``option``, falling back to alphabetical.
 
-    Only values from ``mapping`` are ever returned, so the result is safe to
-    interpolate into a SQL string.
+    ``mapping`` is either an ORDER BY clause table or a table of complete
+    queries keyed by sort option. Only values from ``mapping`` are ever
+    returned, so the result is safe to interpolate into or run as SQL.
     """
     return mapping.get(option or "", mapping["alphabetical"])
@@ -4,7 +4,7 @@ import sqlite3
 
 from fastapi import APIRouter, BackgroundTasks, Depends
 
-from ..database import get_db, new_uuid, now
+from ..database import fetch_dicts, get_db, new_uuid, now, update_by_id_sql
 from ..errors import AppError, ErrorCode
 from ..events import notify_change
 from ..logging_config import get_logger
@@ -14,6 +14,9 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1")
 
+# Columns update_category may write; see update_list for why this is explicit.
+_UPDATABLE_COLUMNS: set[str] = {"name", "color"}
+
 
 @router.get("/lists/{list_id}/categories", response_model=list[CategoryResponse])
 def get_categories(list_id: str, db: sqlite3.Connection = Depends(get_db)) -> list[dict]:
@@ -24,12 +27,12 @@ def get_categories(list_id: str, db: sqlite3.Connection = Depends(get_db)) -> li
     if cursor.fetchone() is None:
         raise AppError(ErrorCode.LIST_NOT_FOUND, "List not found", 404)
 
-    cursor.execute(
+    return fetch_dicts(
+        db,
         "SELECT * FROM categories WHERE list_id = ? AND _deleted = 0 "
         "ORDER BY name COLLATE NOCASE ASC",
         (list_id,),
     )
-    return [dict(row) for row in cursor.fetchall()]
 
 
 @router.post("/lists/{list_id}/categories", response_model=CategoryResponse)
@@ -49,12 +52,12 @@ def create_category(
     timestamp: str = now()
     category_id: str = new_uuid()
 
-    cursor.execute(
-        "INSERT INTO categories (id, list_id, name, color, created_at, updated_at) "
-        "VALUES (?, ?, ?, ?, ?, ?)",
-        (category_id, list_id, data.name, data.color, timestamp, timestamp),
-    )
-    db.commit()
+    with db:
+        cursor.execute(
+            "INSERT INTO categories (id, list_id, name, color, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (category_id, list_id, data.name, data.color, timestamp, timestamp),
+        )
 
     notify_change(bg, "categories_changed", "categories", list_id)
     logger.info("category_created", category_id=category_id, list_id=list_id, name=data.name[:50])
@@ -83,18 +86,17 @@ def update_category(
     if row is None:
         raise AppError(ErrorCode.CATEGORY_NOT_FOUND, "Category not found", 404)
 
-    updates: list[str] = ["updated_at = ?"]
-    values: list[str] = [now()]
-    if data.name is not None:
-        updates.append("name = ?")
-        values.append(data.name)
-    if data.color is not None:
-        updates.append("color = ?")
-        values.append(data.color)
-
-    values.append(category_id)
-    cursor.execute(f"UPDATE categories SET {', '.join(updates)} WHERE id = ?", values)
-    db.commit()
+    # As in update_list: only whitelisted columns are written, and omitted or null
+    # fields are left untouched.
+    changes: dict[str, str] = {
+        "updated_at": now(),
+        **data.model_dump(include=_UPDATABLE_COLUMNS, exclude_unset=True, exclude_none=True),
+    }
+
+    with db:
+        cursor.execute(
+            update_by_id_sql("categories", tuple(changes)), (*changes.values(), category_id)
+        )
 
     notify_change(bg, "categories_changed", "categories", row["list_id"])
     logger.info("category_updated", category_id=category_id)
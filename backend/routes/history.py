@@ -5,27 +5,47 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, Query
 
-from ..database import get_db
+from ..database import fetch_dicts, get_db
 from ..errors import AppError, ErrorCode
 from ..models import SuccessResponse
 
 router = APIRouter(prefix="/api/v1")
 
+# Newest first, walking idx_history_list_id backwards. ``timestamp`` only has
+# second precision, so ``id`` breaks ties and the keyset below compares both:
+# entries logged in the same second are never skipped or repeated across pages.
+_HISTORY_SQL: str = """
+    SELECT * FROM history
+    WHERE list_id = ? AND hidden = 0 AND action NOT LIKE 'undo_%'
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+_HISTORY_BEFORE_SQL: str = """
+    SELECT * FROM history
+    WHERE list_id = ? AND hidden = 0 AND action NOT LIKE 'undo_%'
+      AND (timestamp, id) < (SELECT timestamp, id FROM history WHERE id = ?)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+
 
 @router.get("/lists/{list_id}/history")
-def get_history(list_id: str, db: sqlite3.Connection = Depends(get_db)) -> list[dict[str, Any]]:
-    """Return all visible history entries for a list."""
-    cursor: sqlite3.Cursor = db.cursor()
-    cursor.execute(
-        """
-        SELECT * FROM history
-        WHERE list_id = ? AND hidden = 0 AND action NOT LIKE 'undo_%'
-        ORDER BY timestamp DESC
-    """,
-        (list_id,),
-    )
-    rows: list[sqlite3.Row] = cursor.fetchall()
-    return [dict(row) for row in rows]
+def get_history(
+    list_id: str,
+    before: int | None = Query(None, ge=1),
+    limit: int | None = Query(None, ge=1, le=1000),
+    db: sqlite3.Connection = Depends(get_db),
+) -> list[dict[str, Any]]:
+    """Return visible history entries for a list, newest first.
+
+    Without ``limit`` every entry is returned. To page, pass ``limit`` and then
+    the ``id`` of the last entry received as ``before`` for the next page.
+    """
+    # SQLite treats a negative LIMIT as "no limit".
+    row_limit: int = -1 if limit is None else limit
+    if before is None:
+        return fetch_dicts(db, _HISTORY_SQL, (list_id, row_limit))
+    return fetch_dicts(db, _HISTORY_BEFORE_SQL, (list_id, before, row_limit))
 
 
 @router.post("/lists/{list_id}/history/hide", response_model=SuccessResponse)
@@ -36,11 +56,11 @@ def hide_item_history(
 ) -> dict:
     """Soft-hide every history entry for one item ("remove from history")."""
     cursor: sqlite3.Cursor = db.cursor()
-    cursor.execute(
-        "UPDATE history SET hidden = 1 WHERE list_id = ? AND item_id = ?",
-        (list_id, item_id),
-    )
+    with db:
+        cursor.execute(
+            "UPDATE history SET hidden = 1 WHERE list_id = ? AND item_id = ?",
+            (list_id, item_id),
+        )
     if cursor.rowcount == 0:
         raise AppError(ErrorCode.ITEM_NOT_FOUND, "No history found for this item", 404)
-    db.commit()
     return {"success": True}
@@ -5,7 +5,8 @@ from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends
 
-from ..database import get_db, log_history, new_uuid, now
+from ..cache import list_sort_cache
+from ..database import fetch_dicts, get_db, log_history, new_uuid, now, update_by_id_sql
 from ..errors import AppError, ErrorCode
 from ..events import notify_change
 from ..history import log_item_diff
@@ -23,34 +24,29 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1")
 
+# Full item queries per sort option, built once so each request reuses the same
+# SQL string (and thus sqlite3's cached prepared statement) without formatting.
+_OPEN_ITEMS_SQL: dict[str, str] = {
+    option: "SELECT * FROM items WHERE list_id = ? AND _deleted = 0 AND completed = 0 "
+    f"ORDER BY {order_by}"
+    for option, order_by in SORT_SQL.items()
+}
+_ALL_ITEMS_SQL: dict[str, str] = {
+    option: f"SELECT * FROM items WHERE list_id = ? AND _deleted = 0 ORDER BY completed, {order_by}"
+    for option, order_by in SORT_SQL.items()
+}
+
 
 @router.get("/lists/{list_id}/items", response_model=list[ItemResponse])
 def get_items(
     list_id: str, include_completed: bool = False, db: sqlite3.Connection = Depends(get_db)
 ) -> list[dict]:
     """Return non-deleted items for a list, sorted according to list settings."""
-    cursor: sqlite3.Cursor = db.cursor()
-
-    cursor.execute("SELECT item_sort FROM lists WHERE id = ? AND _deleted = 0", (list_id,))
-    row: sqlite3.Row | None = cursor.fetchone()
-    if row is None:
+    item_sort: str | None = list_sort_cache.get(db, list_id)
+    if item_sort is None:
         raise AppError(ErrorCode.LIST_NOT_FOUND, "List not found", 404)
-    order_by: str = resolve_sort_sql(row["item_sort"], SORT_SQL)
-
-    if include_completed:
-        cursor.execute(
-            f"SELECT * FROM items WHERE list_id = ? AND _deleted = 0 "
-            f"ORDER BY completed, {order_by}",
-            (list_id,),
-        )
-    else:
-        cursor.execute(
-            f"SELECT * FROM items WHERE list_id = ? AND _deleted = 0 AND completed = 0 "
-            f"ORDER BY {order_by}",
-            (list_id,),
-        )
-    rows: list[sqlite3.Row] = cursor.fetchall()
-    return [dict(row) for row in rows]
+    queries: dict[str, str] = _ALL_ITEMS_SQL if include_completed else _OPEN_ITEMS_SQL
+    return fetch_dicts(db, resolve_sort_sql(item_sort, queries), (list_id,))
 
 
 @router.post("/lists/{list_id}/items", response_model=ItemResponse)
@@ -65,16 +61,15 @@ def create_item(
     timestamp: str = now()
     item_id: str = new_uuid()
 
-    cursor.execute(
-        "INSERT INTO items (id, list_id, text, category_id, created_at, updated_at) "
-        "VALUES (?, ?, ?, ?, ?, ?)",
-        (item_id, list_id, item_data.text, item_data.category_id, timestamp, timestamp),
-    )
-
-    if not item_data.undo:
-        log_history(cursor, list_id, "item_created", item_data.text, item_id)
+    with db:
+        cursor.execute(
+            "INSERT INTO items (id, list_id, text, category_id, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (item_id, list_id, item_data.text, item_data.category_id, timestamp, timestamp),
+        )
+        if not item_data.undo:
+            log_history(cursor, list_id, "item_created", item_data.text, item_id)
 
-    db.commit()
     notify_change(bg, "items_changed", "items", list_id)
     logger.info("item_created", item_id=item_id, list_id=list_id, text=item_data.text[:50])
     return {
@@ -105,6 +100,9 @@ def _staged_item_changes(
         changes["category_id"] = item_data.category_id
     if item_data.completed is not None and bool(item_data.completed) != bool(item["completed"]):
         changes["completed"] = int(item_data.completed)
+        # The request's shared ``timestamp``, not SQLite's CURRENT_TIMESTAMP: that
+        # would use a different format ("YYYY-MM-DD HH:MM:SS", no Z) than every
+        # other replicated timestamp and could disagree with ``updated_at``.
         changes["completed_at"] = timestamp if item_data.completed else None
     return changes
 
@@ -117,6 +115,13 @@ def update_item(
     db: sqlite3.Connection = Depends(get_db),
 ) -> dict:
     """Update item text, category, and/or completion status with history logging."""
+    if (
+        item_data.completed is not None
+        and item_data.text is None
+        and "category_id" not in item_data.model_fields_set
+    ):
+        return _update_completion(item_id, item_data.completed, item_data.undo, bg, db)
+
     cursor: sqlite3.Cursor = db.cursor()
 
     cursor.execute("SELECT * FROM items WHERE id = ? AND _deleted = 0", (item_id,))
@@ -130,19 +135,59 @@ def update_item(
     if not changes:
         return {"success": True}
 
-    new_values: dict[str, Any] = {**dict(item), **changes, "updated_at": timestamp}
-    log_item_diff(cursor, dict(item), new_values, undo=item_data.undo)
-
     changes["updated_at"] = timestamp
-    assignments: str = ", ".join(f"{column} = ?" for column in changes)
-    cursor.execute(f"UPDATE items SET {assignments} WHERE id = ?", (*changes.values(), item_id))
-    db.commit()
+    old_values: dict[str, Any] = dict(item)
+    new_values: dict[str, Any] = {**old_values, **changes}
+
+    with db:
+        cursor.execute(update_by_id_sql("items", tuple(changes)), (*changes.values(), item_id))
+        log_item_diff(cursor, old_values, new_values, undo=item_data.undo)
     notify_change(bg, "items_changed", "items", item["list_id"])
     logger.info("item_updated", item_id=item_id)
 
     return {"success": True}
 
 
+def _update_completion(
+    item_id: str, completed: bool, undo: bool, bg: BackgroundTasks, db: sqlite3.Connection
+) -> dict:
+    """Toggle completion with one ``UPDATE ... RETURNING`` instead of select-then-write.
+
+    Checking off items is the most frequent write, and it needs nothing from the
+    stored row beyond what RETURNING hands back. The ``COALESCE(...) != ?`` guard
+    keeps the diff semantics of ``_staged_item_changes``: re-completing an
+    already-completed item writes nothing and logs nothing.
+    """
+    cursor: sqlite3.Cursor = db.cursor()
+    timestamp: str = now()
+    state: int = int(completed)
+
+    with db:
+        cursor.execute(
+            "UPDATE items SET completed = ?, completed_at = ?, updated_at = ? "
+            "WHERE id = ? AND _deleted = 0 AND COALESCE(completed, 0) != ? "
+            "RETURNING list_id, text",
+            (state, timestamp if completed else None, timestamp, item_id, state),
+        )
+        item: sqlite3.Row | None = cursor.fetchone()
+        if item and not undo:
+            action: str = "item_completed" if completed else "item_uncompleted"
+            log_history(cursor, item["list_id"], action, item["text"], item_id)
+
+    if item is None:
+        # No row changed: either the item is already in the requested state
+        # (a no-op) or it does not exist, which only the rare path pays to tell.
+        cursor.execute("SELECT 1 FROM items WHERE id = ? AND _deleted = 0", (item_id,))
+        if cursor.fetchone() is None:
+            logger.warning("item_not_found", item_id=item_id, op="update")
+            raise AppError(ErrorCode.ITEM_NOT_FOUND, "Item not found", 404)
+        return {"success": True}
+
+    notify_change(bg, "items_changed", "items", item["list_id"])
+    logger.info("item_updated", item_id=item_id)
+    return {"success": True}
+
+
 @router.delete("/items/{item_id}", response_model=SuccessResponse)
 def delete_item(
     item_id: str,
@@ -154,20 +199,17 @@ def delete_item(
     cursor: sqlite3.Cursor = db.cursor()
     timestamp: str = now()
 
-    cursor.execute("SELECT * FROM items WHERE id = ? AND _deleted = 0", (item_id,))
-    item: sqlite3.Row | None = cursor.fetchone()
-    list_id: str | None = item["list_id"] if item else None
-
-    if item and not undo:
-        log_history(cursor, item["list_id"], "item_deleted", item["text"], item_id)
-
-    cursor.execute(
-        "UPDATE items SET _deleted = 1, updated_at = ? WHERE id = ?",
-        (timestamp, item_id),
-    )
-    db.commit()
+    with db:
+        cursor.execute(
+            "UPDATE items SET _deleted = 1, updated_at = ? WHERE id = ? AND _deleted = 0 "
+            "RETURNING list_id, text",
+            (timestamp, item_id),
+        )
+        item: sqlite3.Row | None = cursor.fetchone()
+        if item and not undo:
+            log_history(cursor, item["list_id"], "item_deleted", item["text"], item_id)
 
     if item:
-        notify_change(bg, "items_changed", "items", list_id)
+        notify_change(bg, "items_changed", "items", item["list_id"])
     logger.info("item_deleted", item_id=item_id)
     return {"success": True}
@@ -1,15 +1,18 @@
 """List CRUD and reorder endpoints."""
 
 import sqlite3
+from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends
 
-from ..database import get_db, log_history, new_uuid, now
+from ..cache import list_sort_cache, lists_result_cache, settings_cache
+from ..database import fetch_dicts, get_db, log_history, new_uuid, now, update_by_id_sql
 from ..errors import AppError, ErrorCode
 from ..events import broadcast_sync, notify_change
 from ..logging_config import get_logger
 from ..models import (
     LIST_SORT_SQL,
+    SORT_SQL,
     VALID_SORT_OPTIONS,
     ListCreate,
     ListReorder,
@@ -23,28 +26,38 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/api/v1")
 
-
-@router.get("/lists", response_model=list[ListResponse])
-def get_lists(db: sqlite3.Connection = Depends(get_db)) -> list[dict]:
-    """Return all non-deleted lists with item counts, sorted according to settings."""
-    cursor: sqlite3.Cursor = db.cursor()
-
-    cursor.execute("SELECT value FROM settings WHERE key = 'list_sort'")
-    row: sqlite3.Row | None = cursor.fetchone()
-    order_by: str = resolve_sort_sql(row["value"] if row else None, LIST_SORT_SQL)
-
-    cursor.execute(f"""
+# One complete query per sort option so get_lists never formats SQL per request.
+# Counts come from the trigger-maintained list_counts table (see
+# backend.database), so the cost is per list rather than per item.
+_LISTS_SQL: dict[str, str] = {
+    option: f"""
         SELECT l.*,
-               COUNT(i.id) as total_items,
-               SUM(CASE WHEN i.completed = 1 THEN 1 ELSE 0 END) as completed_items
+               COALESCE(c.total_items, 0) as total_items,
+               COALESCE(c.completed_items, 0) as completed_items
         FROM lists l
-        LEFT JOIN items i ON l.id = i.list_id AND i._deleted = 0
+        LEFT JOIN list_counts c ON c.list_id = l.id
         WHERE l._deleted = 0
-        GROUP BY l.id
         ORDER BY {order_by}
-    """)
-    rows: list[sqlite3.Row] = cursor.fetchall()
-    return [dict(row) for row in rows]
+    """
+    for option, order_by in LIST_SORT_SQL.items()
+}
+
+# Columns update_list may write; see the comment there.
+_UPDATABLE_COLUMNS: set[str] = {"name", "icon", "item_sort"}
+_INVALID_SORT_MESSAGE: str = f"Invalid sort option. Valid options: {', '.join(SORT_SQL)}"
+
+
+@router.get("/lists", response_model=list[ListResponse])
+def get_lists(db: sqlite3.Connection = Depends(get_db)) -> list[dict]:
+    """Return all non-deleted lists with item counts, sorted according to settings."""
+    cached: list[dict[str, Any]] | None = lists_result_cache.get()
+    if cached is not None:
+        return cached
+    version: int = lists_result_cache.version()
+    list_sort: str = settings_cache.get(db, "list_sort", "alphabetical")
+    lists: list[dict[str, Any]] = fetch_dicts(db, resolve_sort_sql(list_sort, _LISTS_SQL))
+    lists_result_cache.store(version, lists)
+    return lists
 
 
 @router.post("/lists", response_model=ListResponse)
@@ -58,27 +71,20 @@ def create_list(
     timestamp: str = now()
     list_id: str = new_uuid()
 
-    cursor.execute("SELECT COALESCE(MAX(sort_order), -1) + 1 FROM lists WHERE _deleted = 0")
-    next_sort_order: int = cursor.fetchone()[0]
-
-    cursor.execute(
-        "INSERT INTO lists (id, name, icon, item_sort, sort_order, created_at, updated_at) "
-        "VALUES (?, ?, ?, ?, ?, ?, ?)",
-        (
-            list_id,
-            list_data.name,
-            list_data.icon,
-            "alphabetical",
-            next_sort_order,
-            timestamp,
-            timestamp,
-        ),
-    )
-
-    if not list_data.undo:
-        log_history(cursor, list_id, "list_created", list_data.name)
-
-    db.commit()
+    with db:
+        # Computing the next sort_order inside the INSERT keeps it to one
+        # statement and means two concurrent creates can never share a slot.
+        cursor.execute(
+            "INSERT INTO lists (id, name, icon, item_sort, sort_order, created_at, updated_at) "
+            "SELECT ?, ?, ?, ?, COALESCE(MAX(sort_order), -1) + 1, ?, ? "
+            "FROM lists WHERE _deleted = 0 "
+            "RETURNING sort_order",
+            (list_id, list_data.name, list_data.icon, "alphabetical", timestamp, timestamp),
+        )
+        next_sort_order: int = cursor.fetchone()[0]
+        if not list_data.undo:
+            log_history(cursor, list_id, "list_created", list_data.name)
+
     notify_change(bg, "lists_changed", "lists")
     logger.info("list_created", list_id=list_id, name=list_data.name[:50])
     return {
@@ -103,27 +109,21 @@ def update_list(
     cursor: sqlite3.Cursor = db.cursor()
 
     if list_data.item_sort is not None and list_data.item_sort not in VALID_SORT_OPTIONS:
-        raise AppError(
-            ErrorCode.INVALID_SORT_OPTION,
-            f"Invalid sort option. Valid options: {', '.join(VALID_SORT_OPTIONS)}",
-            400,
-        )
+        raise AppError(ErrorCode.INVALID_SORT_OPTION, _INVALID_SORT_MESSAGE, 400)
+
+    # Only whitelisted columns reach update_by_id_sql, so a future non-column
+    # field (like ListCreate's ``undo``) can never become SQL. Fields the client
+    # omitted or sent as null are left untouched, and model field order keeps the
+    # column tuple (and so the cached statement) stable for each combination.
+    changes: dict[str, str] = {
+        "updated_at": now(),
+        **list_data.model_dump(include=_UPDATABLE_COLUMNS, exclude_unset=True, exclude_none=True),
+    }
 
-    updates: list[str] = ["updated_at = ?"]
-    values: list[str | int] = [now()]
-    if list_data.name is not None:
-        updates.append("name = ?")
-        values.append(list_data.name)
-    if list_data.icon is not None:
-        updates.append("icon = ?")
-        values.append(list_data.icon)
+    with db:
+        cursor.execute(update_by_id_sql("lists", tuple(changes)), (*changes.values(), list_id))
     if list_data.item_sort is not None:
-        updates.append("item_sort = ?")
-        values.append(list_data.item_sort)
-
-    values.append(list_id)
-    cursor.execute(f"UPDATE lists SET {', '.join(updates)} WHERE id = ?", values)
-    db.commit()
+        list_sort_cache.invalidate(list_id)
     notify_change(bg, "lists_changed", "lists", list_id)
     logger.info("list_updated", list_id=list_id)
 
@@ -149,6 +149,7 @@ def delete_list(
             "UPDATE lists SET _deleted = 1, updated_at = ? WHERE id = ?",
             (timestamp, list_id),
         )
+    list_sort_cache.invalidate(list_id)
 
     notify_change(bg, "lists_changed", "lists")
     bg.add_task(broadcast_sync, "items")
@@ -163,15 +164,13 @@ def reorder_lists(
     db: sqlite3.Connection = Depends(get_db),
 ) -> dict:
     """Update the sort order of lists based on provided order."""
-    cursor: sqlite3.Cursor = db.cursor()
     timestamp: str = now()
+    rows: list[tuple[int, str, str]] = [
+        (index, timestamp, list_id) for index, list_id in enumerate(reorder_data.list_ids)
+    ]
 
-    for index, list_id in enumerate(reorder_data.list_ids):
-        cursor.execute(
-            "UPDATE lists SET sort_order = ?, updated_at = ? WHERE id = ?",
-            (index, timestamp, list_id),
-        )
+    with db:
+        db.executemany("UPDATE lists SET sort_order = ?, updated_at = ? WHERE id = ?", rows)
 
-    db.commit()
     notify_change(bg, "lists_changed", "lists")
     return {"success": True}
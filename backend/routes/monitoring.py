@@ -21,8 +21,12 @@ _app_start_time: float = time.time()
 
 
 @router.get("/health")
-async def health_check(db: sqlite3.Connection = Depends(get_db)):
-    """Return application health status including database connectivity."""
+def health_check(db: sqlite3.Connection = Depends(get_db)):
+    """Return application health status including database connectivity.
+
+    Deliberately sync: FastAPI runs it in the threadpool, so the blocking
+    SQLite probe never stalls the event loop that serves the SSE streams.
+    """
     now: str = datetime.now(UTC).isoformat()
 
     try:
@@ -4,20 +4,20 @@ import sqlite3
 
 from fastapi import APIRouter, Depends
 
+from ..cache import lists_result_cache, settings_cache
 from ..database import get_db
 from ..errors import AppError, ErrorCode
-from ..models import VALID_LIST_SORT_OPTIONS, SettingsUpdate, SuccessResponse
+from ..models import LIST_SORT_SQL, VALID_LIST_SORT_OPTIONS, SettingsUpdate, SuccessResponse
 
 router = APIRouter(prefix="/api/v1")
 
+_INVALID_LIST_SORT_MESSAGE: str = f"Invalid list sort option. Valid: {', '.join(LIST_SORT_SQL)}"
+
 
 @router.get("/settings")
 def get_settings(db: sqlite3.Connection = Depends(get_db)) -> dict[str, str]:
     """Return all app settings."""
-    cursor: sqlite3.Cursor = db.cursor()
-    cursor.execute("SELECT key, value FROM settings")
-    rows: list[sqlite3.Row] = cursor.fetchall()
-    return {row["key"]: row["value"] for row in rows}
+    return settings_cache.get_all(db)
 
 
 @router.put("/settings", response_model=SuccessResponse)
@@ -29,15 +29,14 @@ def update_settings(
 
     if settings_data.list_sort is not None:
         if settings_data.list_sort not in VALID_LIST_SORT_OPTIONS:
-            raise AppError(
-                ErrorCode.INVALID_SORT_OPTION,
-                f"Invalid list sort option. Valid: {', '.join(VALID_LIST_SORT_OPTIONS)}",
-                400,
+            raise AppError(ErrorCode.INVALID_SORT_OPTION, _INVALID_LIST_SORT_MESSAGE, 400)
+        with db:
+            cursor.execute(
+                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                ("list_sort", settings_data.list_sort),
             )
-        cursor.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
-            ("list_sort", settings_data.list_sort),
-        )
 
-    db.commit()
+    if settings_data.list_sort is not None:
+        settings_cache.set("list_sort", settings_data.list_sort)
+        lists_result_cache.invalidate()
     return {"success": True}
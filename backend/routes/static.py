@@ -1,9 +1,11 @@
 """Static file serving and PWA endpoints."""
 
+import hashlib
+from dataclasses import dataclass
 from functools import cache
 from pathlib import Path
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
@@ -14,6 +16,25 @@ router = APIRouter()
 DIST_DIR = Path("static/dist")
 LEGACY_ICON_DIR = Path("static/icons")
 
+# Headers for the app shell and scripts that must never be served stale.
+_NO_STORE_HEADERS: dict[str, str] = {
+    "Cache-Control": "no-cache, no-store, must-revalidate",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
+
+
+@dataclass(frozen=True)
+class _ShellAsset:
+    """In-memory copy of one shell file, valid while its mtime is unchanged."""
+
+    mtime_ns: int
+    body: bytes
+    etag: str
+
+
+_shell_assets: dict[Path, _ShellAsset] = {}
+
 
 @cache
 def _icon_index() -> dict[str, Path]:
@@ -33,6 +54,39 @@ def _icon_index() -> dict[str, Path]:
     return index
 
 
+def _load_shell_asset(*candidates: Path) -> _ShellAsset:
+    """Return the first existing candidate's bytes, re-reading only when it changed.
+
+    Each request costs one ``stat()`` instead of ``FileResponse``'s open and
+    read; comparing ``st_mtime_ns`` still picks up a rebuilt frontend without a
+    restart. Concurrent misses just read the file twice.
+    """
+    for path in candidates:
+        try:
+            mtime_ns: int = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            continue
+        cached: _ShellAsset | None = _shell_assets.get(path)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+        body: bytes = path.read_bytes()
+        asset: _ShellAsset = _ShellAsset(
+            mtime_ns, body, f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        )
+        _shell_assets[path] = asset
+        return asset
+    raise FileNotFoundError(f"None of {[str(path) for path in candidates]} exist")
+
+
+def _shell_response(
+    request: Request, asset: _ShellAsset, media_type: str, headers: dict[str, str]
+) -> Response:
+    """Serve ``asset`` with its ETag, or a bodiless 304 when the client already has it."""
+    if request.headers.get("if-none-match") == asset.etag:
+        return Response(status_code=304, headers={**headers, "ETag": asset.etag})
+    return Response(asset.body, media_type=media_type, headers={**headers, "ETag": asset.etag})
+
+
 def mount_static(app) -> None:
     """Mount static file directories on the FastAPI app.
 
@@ -45,59 +99,38 @@ def mount_static(app) -> None:
 
 
 @router.get("/")
-def read_root() -> FileResponse:
+def read_root(request: Request) -> Response:
     """Serve the main HTML page from Vite build or legacy templates."""
-    response: FileResponse
-    if (DIST_DIR / "index.html").exists():
-        response = FileResponse(str(DIST_DIR / "index.html"))
-    else:
-        response = FileResponse("templates/index.html")
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+    asset: _ShellAsset = _load_shell_asset(DIST_DIR / "index.html", Path("templates/index.html"))
+    return _shell_response(request, asset, "text/html", _NO_STORE_HEADERS)
 
 
 @router.get("/manifest.json")
-def manifest() -> FileResponse:
+def manifest(request: Request) -> Response:
     """Serve the PWA manifest file."""
-    response: FileResponse
-    if (DIST_DIR / "manifest.json").exists():
-        response = FileResponse(str(DIST_DIR / "manifest.json"))
-    else:
-        response = FileResponse("static/manifest.json")
-    response.headers["Cache-Control"] = "public, max-age=3600, must-revalidate"
-    return response
+    asset: _ShellAsset = _load_shell_asset(DIST_DIR / "manifest.json", Path("static/manifest.json"))
+    return _shell_response(
+        request,
+        asset,
+        "application/json",
+        {"Cache-Control": "public, max-age=3600, must-revalidate"},
+    )
 
 
 @router.get("/sw.js")
-def service_worker() -> FileResponse:
+def service_worker(request: Request) -> Response:
     """Serve the service worker script."""
-    response: FileResponse
-    if (DIST_DIR / "sw.js").exists():
-        response = FileResponse(str(DIST_DIR / "sw.js"), media_type="application/javascript")
-    else:
-        response = FileResponse("static/sw.js", media_type="application/javascript")
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+    asset: _ShellAsset = _load_shell_asset(DIST_DIR / "sw.js", Path("static/sw.js"))
+    return _shell_response(request, asset, "application/javascript", _NO_STORE_HEADERS)
 
 
 @router.get("/circuit-breaker.js")
-def circuit_breaker() -> FileResponse:
+def circuit_breaker(request: Request) -> Response:
     """Serve the reload-loop circuit breaker script."""
-    response: FileResponse
-    if (DIST_DIR / "circuit-breaker.js").exists():
-        response = FileResponse(
-            str(DIST_DIR / "circuit-breaker.js"), media_type="application/javascript"
-        )
-    else:
-        response = FileResponse("static/circuit-breaker.js", media_type="application/javascript")
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+    asset: _ShellAsset = _load_shell_asset(
+        DIST_DIR / "circuit-breaker.js", Path("static/circuit-breaker.js")
+    )
+    return _shell_response(request, asset, "application/javascript", _NO_STORE_HEADERS)
 
 
 @router.get("/icons/{file_path:path}")
@@ -2,19 +2,21 @@
 
 import asyncio
 import sqlite3
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, Body, Depends, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ValidationError
 
+from ..cache import list_sort_cache
 from ..config import SSE_HEARTBEAT_INTERVAL, TOMBSTONE_RETAIN_DAYS
-from ..database import get_db, now
+from ..database import HistoryEntry, fetch_dicts, get_db, now
 from ..errors import AppError, ErrorCode
 from ..events import notify_change, sync_broadcaster
-from ..history import log_item_diff, log_list_diff
+from ..history import HistoryBuffer, item_diff_entries, list_diff_entries
 from ..logging_config import get_logger
 from ..metrics import sync_metrics
 from ..models import SyncCategoryState, SyncChange, SyncItemState, SyncListState
@@ -25,12 +27,16 @@ logger = get_logger(__name__)
 router = APIRouter(prefix="/api/v1/sync")
 
 
-HistoryLogger = Callable[[sqlite3.Cursor, dict[str, Any] | None, dict[str, Any]], None]
+HistoryDiff = Callable[[Mapping[str, Any] | None, Mapping[str, Any]], list[HistoryEntry]]
 
 
 @dataclass(frozen=True)
 class CollectionSpec:
-    """Describes how to persist and replicate a single RxDB collection."""
+    """Describes how to persist and replicate a single RxDB collection.
+
+    The SQL properties are derived from fixed fields, so each string is built on
+    first use and then reused by every request.
+    """
 
     table: str
     insert_fields: tuple[str, ...]
@@ -38,27 +44,27 @@ class CollectionSpec:
     defaults: Callable[[], dict[str, Any]]
     broadcast_event: str
     document_model: type[BaseModel]
-    log_history: HistoryLogger | None = None
+    history_entries: HistoryDiff | None = None
 
-    @property
+    @cached_property
     def select_sql(self) -> str:
         """SQL for fetching a single document by id."""
         return f"SELECT * FROM {self.table} WHERE id = ?"
 
-    @property
+    @cached_property
     def insert_sql(self) -> str:
         """SQL for inserting a document by positional insert_fields."""
         cols: str = ", ".join(self.insert_fields)
         placeholders: str = ", ".join("?" * len(self.insert_fields))
         return f"INSERT INTO {self.table} ({cols}) VALUES ({placeholders})"
 
-    @property
+    @cached_property
     def update_sql(self) -> str:
         """SQL for updating a document by positional update_fields, keyed on id."""
         assignments: str = ", ".join(f"{f}=?" for f in self.update_fields)
         return f"UPDATE {self.table} SET {assignments} WHERE id=?"
 
-    @property
+    @cached_property
     def pull_sql_checkpoint(self) -> str:
         """SQL for fetching documents strictly newer than the given checkpoint."""
         return (
@@ -67,7 +73,7 @@ class CollectionSpec:
             "ORDER BY updated_at ASC, id ASC LIMIT ?"
         )
 
-    @property
+    @cached_property
     def pull_sql_all(self) -> str:
         """SQL for fetching all documents in replication order."""
         return f"SELECT * FROM {self.table} ORDER BY updated_at ASC, id ASC LIMIT ?"
@@ -139,7 +145,7 @@ COLLECTIONS: dict[str, CollectionSpec] = {
         defaults=_list_defaults,
         broadcast_event="lists_changed",
         document_model=SyncListState,
-        log_history=log_list_diff,
+        history_entries=list_diff_entries,
     ),
     "items": CollectionSpec(
         table="items",
@@ -166,7 +172,7 @@ COLLECTIONS: dict[str, CollectionSpec] = {
         defaults=_item_defaults,
         broadcast_event="items_changed",
         document_model=SyncItemState,
-        log_history=log_item_diff,
+        history_entries=item_diff_entries,
     ),
     "categories": CollectionSpec(
         table="categories",
@@ -188,7 +194,7 @@ COLLECTIONS: dict[str, CollectionSpec] = {
         defaults=_category_defaults,
         broadcast_event="categories_changed",
         document_model=SyncCategoryState,
-        log_history=None,
+        history_entries=None,
     ),
 }
 
@@ -201,25 +207,27 @@ def _require_spec(collection: str) -> CollectionSpec:
     return spec
 
 
-def _select_doc(cursor: sqlite3.Cursor, spec: CollectionSpec, doc_id: str) -> sqlite3.Row | None:
+def _select_doc(cursor: sqlite3.Cursor, spec: CollectionSpec, doc_id: str) -> dict[str, Any] | None:
     """Select a single document by id from the collection described by ``spec``."""
     cursor.execute(spec.select_sql, (doc_id,))
-    return cursor.fetchone()
+    row: Sequence[Any] | None = cursor.fetchone()
+    if row is None:
+        return None
+    keys: tuple[str, ...] = tuple(column[0] for column in cursor.description)
+    return dict(zip(keys, row, strict=True))
 
 
 def _pull_docs(
-    cursor: sqlite3.Cursor,
+    db: sqlite3.Connection,
     spec: CollectionSpec,
     updated_at: str | None,
     id: str | None,
     limit: int,
-) -> list[sqlite3.Row]:
+) -> list[dict[str, Any]]:
     """Fetch a page of replication documents, optionally newer than a checkpoint."""
     if updated_at and id:
-        cursor.execute(spec.pull_sql_checkpoint, (updated_at, updated_at, id, limit))
-    else:
-        cursor.execute(spec.pull_sql_all, (limit,))
-    return cursor.fetchall()
+        return fetch_dicts(db, spec.pull_sql_checkpoint, (updated_at, updated_at, id, limit))
+    return fetch_dicts(db, spec.pull_sql_all, (limit,))
 
 
 def _resolve_values(
@@ -306,10 +314,7 @@ def sync_pull(
             410,
         )
 
-    cursor: sqlite3.Cursor = db.cursor()
-
-    rows: list[sqlite3.Row] = _pull_docs(cursor, spec, updated_at, id, limit)
-    documents: list[dict[str, Any]] = [dict(row) for row in rows]
+    documents: list[dict[str, Any]] = _pull_docs(db, spec, updated_at, id, limit)
 
     checkpoint: dict[str, Any] | None = None
     if documents:
@@ -338,8 +343,12 @@ def sync_push(
     """
     spec: CollectionSpec = _require_spec(collection)
     cursor: sqlite3.Cursor = db.cursor()
+    # Every read on this cursor goes through _select_doc, which keys the tuple
+    # itself; skipping sqlite3.Row saves an object per pushed document.
+    cursor.row_factory = None
     conflicts: list[dict[str, Any]] = []
     wrote_any: bool = False
+    history: HistoryBuffer = HistoryBuffer()
 
     with db:
         for change in changes:
@@ -357,8 +366,7 @@ def sync_push(
 
             doc_id: str = new_state["id"]
 
-            current: sqlite3.Row | None = _select_doc(cursor, spec, doc_id)
-            current_dict: dict[str, Any] | None = dict(current) if current else None
+            current_dict: dict[str, Any] | None = _select_doc(cursor, spec, doc_id)
 
             try:
                 if assumed is None:
@@ -366,17 +374,19 @@ def sync_push(
                         conflicts.append(current_dict)
                         continue
                     _insert_doc(cursor, spec, new_state)
-                    if spec.log_history is not None:
-                        spec.log_history(cursor, None, new_state)
+                    if spec.history_entries is not None:
+                        history.extend(spec.history_entries(None, new_state))
                 else:
                     if not current_dict:
                         _insert_doc(cursor, spec, new_state)
-                        if spec.log_history is not None:
-                            spec.log_history(cursor, None, new_state)
+                        if spec.history_entries is not None:
+                            history.extend(spec.history_entries(None, new_state))
                     elif _states_match(current_dict, assumed):
                         _update_doc(cursor, spec, new_state, current_dict)
-                        if spec.log_history is not None:
-                            spec.log_history(cursor, current_dict, {**current_dict, **new_state})
+                        if spec.history_entries is not None:
+                            history.extend(
+                                spec.history_entries(current_dict, {**current_dict, **new_state})
+                            )
                     else:
                         conflicts.append(current_dict)
                         continue
@@ -388,12 +398,20 @@ def sync_push(
                     doc_id=doc_id,
                     error=str(exc),
                 )
-                refreshed: sqlite3.Row | None = _select_doc(cursor, spec, doc_id)
+                refreshed: dict[str, Any] | None = _select_doc(cursor, spec, doc_id)
                 if refreshed:
-                    conflicts.append(dict(refreshed))
+                    conflicts.append(refreshed)
                 else:
                     raise AppError(ErrorCode.CONFLICT, str(exc), 409) from exc
 
+        # One statement for the whole batch's history, still inside the
+        # transaction so it commits (or rolls back) with the documents.
+        history.flush(cursor)
+
+    if wrote_any and spec.table == "lists":
+        # A pushed list may have changed its item_sort or been (un)deleted.
+        list_sort_cache.clear()
+
     sync_metrics.record_push(len(changes), len(conflicts))
 
     if wrote_any:
@@ -8,6 +8,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from backend import config
+from backend.cache import list_sort_cache, lists_result_cache, settings_cache
 from backend.database import get_db, init_db
 from backend.main import app, rate_limit_store
 
@@ -47,6 +48,14 @@ def clear_rate_limits() -> None:
     rate_limit_store.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> None:
+    """Drop process-local caches so no test sees another test's database."""
+    settings_cache.clear()
+    list_sort_cache.clear()
+    lists_result_cache.invalidate()
+
+
 @pytest.fixture()
 def client() -> TestClient:
     """Provide a TestClient that returns HTTP error responses instead of raising."""
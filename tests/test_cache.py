@@ -0,0 +1,124 @@
+"""Tests for the process-local read caches."""
+
+from backend.cache import ListSortCache, ResultCache, SettingsCache
+
+
+class TestSettingsCache:
+    """Tests for ``SettingsCache``."""
+
+    def test_reads_are_served_from_memory_after_first_load(self, db) -> None:
+        """Once loaded, reads no longer consult the database."""
+        cache = SettingsCache()
+        assert cache.get(db, "list_sort", "x") == "alphabetical"
+        db.execute("UPDATE settings SET value = 'custom' WHERE key = 'list_sort'")
+        assert cache.get(db, "list_sort", "x") == "alphabetical"
+
+    def test_set_writes_through(self, db) -> None:
+        """A recorded write is visible to the next read."""
+        cache = SettingsCache()
+        cache.get_all(db)
+        cache.set("list_sort", "created_desc")
+        assert cache.get(db, "list_sort", "x") == "created_desc"
+
+    def test_missing_key_returns_default(self, db) -> None:
+        """Unset keys fall back to the caller's default."""
+        assert SettingsCache().get(db, "nope", "fallback") == "fallback"
+
+    def test_clear_forces_reload(self, db) -> None:
+        """After ``clear()`` the next read picks up the current database value."""
+        cache = SettingsCache()
+        cache.get_all(db)
+        db.execute("UPDATE settings SET value = 'custom' WHERE key = 'list_sort'")
+        cache.clear()
+        assert cache.get(db, "list_sort", "x") == "custom"
+
+
+class TestListSortCache:
+    """Tests for ``ListSortCache``."""
+
+    def test_sort_is_served_from_memory_after_first_read(self, db, create_list) -> None:
+        """Once a list's sort is loaded, reads no longer consult the database."""
+        lst = create_list()
+        cache = ListSortCache()
+        assert cache.get(db, lst["id"]) == "alphabetical"
+        db.execute("UPDATE lists SET item_sort = 'created_desc' WHERE id = ?", (lst["id"],))
+        assert cache.get(db, lst["id"]) == "alphabetical"
+
+    def test_invalidate_forces_reload(self, db, create_list) -> None:
+        """After ``invalidate()`` the next read picks up the current value."""
+        lst = create_list()
+        cache = ListSortCache()
+        cache.get(db, lst["id"])
+        db.execute("UPDATE lists SET item_sort = 'created_desc' WHERE id = ?", (lst["id"],))
+        cache.invalidate(lst["id"])
+        assert cache.get(db, lst["id"]) == "created_desc"
+
+    def test_missing_list_is_not_cached(self, db, create_list) -> None:
+        """An unknown id returns ``None`` and is looked up again next time."""
+        cache = ListSortCache()
+        assert cache.get(db, "nope") is None
+        lst = create_list()
+        assert cache.get(db, lst["id"]) == "alphabetical"
+
+    def test_oldest_entry_is_evicted_at_capacity(self, db, create_list) -> None:
+        """The cache never holds more than ``maxsize`` lists."""
+        first = create_list(name="A")
+        second = create_list(name="B")
+        cache = ListSortCache(maxsize=1)
+        cache.get(db, first["id"])
+        cache.get(db, second["id"])
+        db.execute("UPDATE lists SET item_sort = 'created_desc' WHERE id = ?", (first["id"],))
+        assert cache.get(db, first["id"]) == "created_desc"
+
+    def test_sync_push_of_lists_invalidates(self, client, create_list) -> None:
+        """A list sort changed through sync is visible to the next item listing."""
+        lst = create_list()
+        client.post(f"/api/v1/lists/{lst['id']}/items", json={"text": "b"})
+        client.post(f"/api/v1/lists/{lst['id']}/items", json={"text": "a"})
+        assert client.get(f"/api/v1/lists/{lst['id']}/items").status_code == 200
+
+        current = client.get("/api/v1/sync/lists/pull").json()["documents"][0]
+        new_state = {**current, "item_sort": "alphabetical_desc"}
+        resp = client.post(
+            "/api/v1/sync/lists/push",
+            json=[{"newDocumentState": new_state, "assumedMasterState": current}],
+        )
+        assert resp.json() == []
+
+        texts = [item["text"] for item in client.get(f"/api/v1/lists/{lst['id']}/items").json()]
+        assert texts == ["b", "a"]
+
+
+class TestResultCache:
+    """Tests for ``ResultCache`` and the cached ``get_lists`` result."""
+
+    def test_store_after_invalidate_is_discarded(self) -> None:
+        """A result computed before an invalidation is never cached."""
+        cache = ResultCache()
+        version = cache.version()
+        cache.invalidate()
+        cache.store(version, ["stale"])
+        assert cache.get() is None
+
+    def test_store_without_race_is_kept(self) -> None:
+        """A result stored under the current version is served until invalidated."""
+        cache = ResultCache()
+        cache.store(cache.version(), ["fresh"])
+        assert cache.get() == ["fresh"]
+        cache.invalidate()
+        assert cache.get() is None
+
+    def test_item_write_refreshes_cached_lists(self, client, create_list, create_item) -> None:
+        """Item counts in GET /lists reflect writes made after a cached read."""
+        lst = create_list()
+        assert client.get("/api/v1/lists").json()[0]["total_items"] == 0
+        create_item(lst["id"])
+        assert client.get("/api/v1/lists").json()[0]["total_items"] == 1
+
+    def test_settings_write_refreshes_cached_lists(self, client, create_list) -> None:
+        """Changing list_sort re-sorts GET /lists even after a cached read."""
+        create_list(name="A")
+        create_list(name="B")
+        assert [x["name"] for x in client.get("/api/v1/lists").json()] == ["A", "B"]
+        client.put("/api/v1/settings", json={"list_sort": "alphabetical_desc"})
+        assert [x["name"] for x in client.get("/api/v1/lists").json()] == ["B", "A"]
@@ -0,0 +1,299 @@
+"""Tests for database connection setup and pooling."""
+
+import asyncio
+import sqlite3
+from collections.abc import Iterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import anyio.to_thread
+import httpx
+import pytest
+
+from backend import database, main
+from backend.database import ConnectionPool
+
+
+@pytest.fixture()
+def file_database(tmp_path, monkeypatch) -> Path:
+    """Point the backend at a fresh, initialized file-backed database."""
+    path: Path = tmp_path / "tickr.db"
+    monkeypatch.setattr(database, "DATABASE", str(path))
+    database.init_db()
+    return path
+
+
+@pytest.fixture()
+def pool(file_database, monkeypatch) -> Iterator[ConnectionPool]:
+    """Install a two-connection pool over the file-backed database for ``get_db``."""
+    connection_pool: ConnectionPool = ConnectionPool()
+    connection_pool.open(str(file_database), size=2)
+    monkeypatch.setattr(database, "connection_pool", connection_pool)
+    yield connection_pool
+    connection_pool.close()
+
+
+class TestGetDb:
+    """Tests for the ``get_db`` dependency."""
+
+    def test_connection_is_tuned(self, pool) -> None:
+        """Connections come configured for WAL with the performance PRAGMAs applied."""
+        pragmas = asyncio.run(_pragmas_via_get_db())
+        assert pragmas["journal_mode"] == "wal"
+        assert pragmas["foreign_keys"] == 1
+        assert pragmas["busy_timeout"] == 5000
+        # synchronous: 1 == NORMAL; temp_store: 2 == MEMORY
+        assert pragmas["synchronous"] == 1
+        assert pragmas["temp_store"] == 2
+        assert pragmas["cache_size"] == -64000
+
+    def test_burst_beyond_pool_size_does_not_deadlock(self, pool, monkeypatch) -> None:
+        """Requests waiting for a connection never starve the holders of worker threads."""
+        monkeypatch.delitem(main.app.dependency_overrides, database.get_db)
+        assert asyncio.run(_concurrent_history_reads(count=30, thread_limit=3)) == [200] * 30
+
+
+async def _pragmas_via_get_db() -> dict[str, Any]:
+    """Borrow a connection through ``get_db`` and read back its tuning PRAGMAs."""
+    names = ("journal_mode", "foreign_keys", "busy_timeout", "synchronous", "temp_store")
+    async with asynccontextmanager(database.get_db)() as conn:
+        return {
+            name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in (*names, "cache_size")
+        }
+
+
+async def _concurrent_history_reads(count: int, thread_limit: int) -> list[int]:
+    """Fire ``count`` simultaneous requests through the real ``get_db`` and collect statuses."""
+    anyio.to_thread.current_default_thread_limiter().total_tokens = thread_limit
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        responses: list[httpx.Response] = await asyncio.wait_for(
+            asyncio.gather(*[client.get("/api/v1/lists/none/history") for _ in range(count)]),
+            timeout=10,
+        )
+    return [response.status_code for response in responses]
+
+
+class TestConnectionPool:
+    """Tests for ``ConnectionPool``."""
+
+    def test_acquire_before_open_raises(self) -> None:
+        """Borrowing from a pool that was never opened fails loudly instead of blocking."""
+        with pytest.raises(RuntimeError):
+            ConnectionPool().acquire()
+
+    def test_released_connection_is_reused(self, pool) -> None:
+        """A released connection goes back to the pool rather than being closed."""
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        pool.release(first)
+        pool.release(second)
+
+    def test_most_recently_released_connection_is_preferred(self, pool) -> None:
+        """Idle connections are reused LIFO so the warmest page cache serves next."""
+        first = pool.acquire()
+        second = pool.acquire()
+        pool.release(first)
+        pool.release(second)
+        assert pool.acquire() is second
+        pool.release(second)
+
+    def test_release_rolls_back_open_transaction(self, pool) -> None:
+        """Uncommitted writes from a failed handler never leak to the next borrower."""
+        conn = pool.acquire()
+        conn.execute("INSERT INTO settings (key, value) VALUES ('leak', 'x')")
+        assert conn.in_transaction
+        pool.release(conn)
+        assert not conn.in_transaction
+        row = conn.execute("SELECT COUNT(*) FROM settings WHERE key = 'leak'").fetchone()
+        assert row[0] == 0
+
+    def test_release_after_close_closes_the_connection(self, pool) -> None:
+        """A handler finishing after shutdown never puts a connection back in the pool."""
+        borrowed = pool.acquire()
+        pool.close()
+        borrowed.execute("SELECT 1")
+        pool.release(borrowed)
+        with pytest.raises(sqlite3.ProgrammingError):
+            borrowed.execute("SELECT 1")
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+    def test_connection_from_before_reopen_is_not_reused(self, pool, file_database) -> None:
+        """Reopening a closed pool never hands out a connection from the old one."""
+        borrowed = pool.acquire()
+        pool.close()
+        pool.open(str(file_database), size=1)
+        pool.release(borrowed)
+        fresh = pool.acquire()
+        assert fresh is not borrowed
+        pool.release(fresh)
+
+    def test_purge_job_does_not_need_a_pooled_connection(
+        self, pool, file_database, monkeypatch
+    ) -> None:
+        """The tombstone purge still runs while every pooled connection is borrowed."""
+        monkeypatch.setattr(main, "DATABASE", str(file_database))
+        borrowed = [pool.acquire(), pool.acquire()]
+        assert main._run_purge() == 0
+        for conn in borrowed:
+            pool.release(conn)
+
+
+class TestFetchDicts:
+    """Tests for ``fetch_dicts``."""
+
+    def test_rows_come_back_as_plain_dicts(self, db) -> None:
+        """Each row is a dict keyed by column name, in query order."""
+        rows = database.fetch_dicts(
+            db, "SELECT key, value FROM settings WHERE key = ?", ("list_sort",)
+        )
+        assert rows == [{"key": "list_sort", "value": "alphabetical"}]
+
+    def test_connection_row_factory_is_untouched(self, db) -> None:
+        """Only the helper's own cursor drops ``sqlite3.Row``; later queries keep it."""
+        database.fetch_dicts(db, "SELECT 1 AS one")
+        assert db.execute("SELECT 1 AS one").fetchone()["one"] == 1
+
+
+class TestUpdateByIdSql:
+    """Tests for ``update_by_id_sql``."""
+
+    def test_statement_is_built_once_per_shape(self) -> None:
+        """The same column set returns the identical cached statement."""
+        sql = database.update_by_id_sql("lists", ("updated_at", "name"))
+        assert sql == "UPDATE lists SET updated_at = ?, name = ? WHERE id = ?"
+        assert database.update_by_id_sql("lists", ("updated_at", "name")) is sql
+
+
+class TestIndexes:
+    """Tests for the hot-path indexes."""
+
+    def test_alphabetical_items_are_read_in_index_order(self, db) -> None:
+        """The default item listing walks idx_items_list_sort instead of sorting."""
+        plan = db.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM items WHERE list_id = ? AND _deleted = 0 "
+            "AND completed = 0 ORDER BY text COLLATE NOCASE ASC",
+            ("list-1",),
+        ).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "idx_items_list_sort" in details
+        assert "TEMP B-TREE" not in details
+
+    def test_file_bootstrap_replaces_superseded_index(self, file_database) -> None:
+        """Upgraded databases drop the old items index in favour of the sort-aware one."""
+        conn = sqlite3.connect(file_database)
+        conn.execute("DROP INDEX idx_items_list_sort")
+        conn.execute("CREATE INDEX idx_items_list_completed ON items(list_id, _deleted, completed)")
+        conn.close()
+        database.init_db()
+        conn = sqlite3.connect(file_database)
+        names = {row[1] for row in conn.execute("PRAGMA index_list(items)")}
+        conn.close()
+        assert "idx_items_list_sort" in names
+        assert "idx_items_list_completed" not in names
+
+    def test_fresh_and_upgraded_schemas_share_indexes(self, db, file_database) -> None:
+        """In-memory, fresh-file and upgraded databases end up with the same indexes."""
+        query = "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+        memory_names = {row[0] for row in db.execute(query)}
+        conn = sqlite3.connect(file_database)
+        fresh_names = {row[0] for row in conn.execute(query)}
+        conn.execute("DROP INDEX idx_history_list_id")
+        conn.close()
+        database.init_db()
+        conn = sqlite3.connect(file_database)
+        upgraded_names = {row[0] for row in conn.execute(query)}
+        conn.close()
+        assert memory_names == fresh_names == upgraded_names
+
+
+def _aggregate_counts(db) -> dict[str, tuple[int, int]]:
+    """Recompute per-list live item counts the slow way, for comparison."""
+    rows = db.execute(
+        "SELECT list_id, COUNT(*), SUM(completed IS 1) FROM items "
+        "WHERE _deleted = 0 GROUP BY list_id"
+    ).fetchall()
+    return {row[0]: (row[1], row[2]) for row in rows}
+
+
+def _maintained_counts(db) -> dict[str, tuple[int, int]]:
+    """Read the trigger-maintained counts, ignoring lists with no live items."""
+    rows = db.execute(
+        "SELECT list_id, total_items, completed_items FROM list_counts WHERE total_items > 0"
+    ).fetchall()
+    return {row[0]: (row[1], row[2]) for row in rows}
+
+
+class TestListCounts:
+    """Tests for the trigger-maintained ``list_counts`` table."""
+
+    def test_counts_track_every_item_write(self, client, db, create_list, create_item) -> None:
+        """Creates, completions, moves, deletes and hard deletes keep counts exact."""
+        home = create_list(name="Home")
+        work = create_list(name="Work")
+        first = create_item(home["id"], text="a")
+        second = create_item(home["id"], text="b")
+        create_item(work["id"], text="c")
+        client.put(f"/api/v1/items/{first['id']}", json={"completed": True})
+        client.put(f"/api/v1/items/{second['id']}", json={"completed": True})
+        client.put(f"/api/v1/items/{second['id']}", json={"completed": False})
+        db.execute("UPDATE items SET list_id = ? WHERE id = ?", (work["id"], second["id"]))
+        client.delete(f"/api/v1/items/{first['id']}")
+        db.execute("DELETE FROM items WHERE id = ?", (second["id"],))
+        assert _maintained_counts(db) == _aggregate_counts(db)
+
+    def test_bootstrap_backfills_existing_items(self, file_database) -> None:
+        """Counts are rebuilt at startup, covering rows written without the triggers."""
+        conn = sqlite3.connect(file_database)
+        list_id = conn.execute("SELECT id FROM lists").fetchone()[0]
+        conn.execute("DROP TRIGGER trg_list_counts_insert")
+        conn.execute(
+            "INSERT INTO items (id, list_id, text, completed, created_at, updated_at) "
+            "VALUES ('i1', ?, 'x', 1, 't', 't')",
+            (list_id,),
+        )
+        conn.commit()
+        conn.close()
+        database.init_db()
+        conn = sqlite3.connect(file_database)
+        row = conn.execute(
+            "SELECT total_items, completed_items FROM list_counts WHERE list_id = ?", (list_id,)
+        ).fetchone()
+        conn.close()
+        assert row == (1, 1)
+
+    def test_sync_push_with_null_completed_is_counted(self, client, db, create_list) -> None:
+        """A pushed item with ``completed: null`` counts as open instead of failing the push."""
+        lst = create_list()
+        item = {"id": "null-completed", "list_id": lst["id"], "text": "x", "completed": None}
+        resp = client.post(
+            "/api/v1/sync/items/push",
+            json=[{"newDocumentState": item, "assumedMasterState": None}],
+        )
+        assert resp.status_code == 200
+        assert resp.json() == []
+        assert _maintained_counts(db) == {lst["id"]: (1, 0)}
+
+    def test_bootstrap_rebuilds_over_null_completed_items(self, file_database) -> None:
+        """Startup succeeds and counts an item whose ``completed`` is NULL as open."""
+        conn = sqlite3.connect(file_database)
+        list_id = conn.execute("SELECT id FROM lists").fetchone()[0]
+        conn.execute("DROP TRIGGER trg_list_counts_insert")
+        conn.execute(
+            "INSERT INTO items (id, list_id, text, completed, created_at, updated_at) "
+            "VALUES ('i1', ?, 'x', NULL, 't', 't')",
+            (list_id,),
+        )
+        conn.commit()
+        conn.close()
+        database.init_db()
+        conn = sqlite3.connect(file_database)
+        row = conn.execute(
+            "SELECT total_items, completed_items FROM list_counts WHERE list_id = ?", (list_id,)
+        ).fetchone()
+        conn.close()
+        assert row == (1, 0)
@@ -73,19 +73,26 @@ def test_broadcast_fans_out_to_all_clients() -> None:
     _run(_test())
 
 
-def test_broadcast_drops_when_queue_full() -> None:
-    """Full client queues silently drop messages instead of blocking publishers."""
+def test_broadcast_evicts_client_when_queue_full() -> None:
+    """A client whose queue overflows is disconnected instead of blocking publishers."""
 
     async def _test() -> None:
         """Run the async assertions for this test on a fresh event loop."""
         bc = SseBroadcaster("test", max_clients=3, queue_size=4)
         bc.bind_loop(asyncio.get_running_loop())
-        q = await bc.register()
+        slow = await bc.register()
+        fast = await bc.register()
         for i in range(4):
             bc.broadcast(f"msg-{i}")
+        await asyncio.sleep(0)
+        fast.get_nowait()
         bc.broadcast("overflow")
         await asyncio.sleep(0)
-        assert q.qsize() == 4
+        assert bc.client_count() == 1
+        assert fast.qsize() == 4
+        gen = cast(AsyncGenerator[str], bc.stream(slow, heartbeat=5))
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
 
     _run(_test())
 
@@ -122,3 +129,41 @@ def test_stream_delivers_broadcast_message() -> None:
         await gen.aclose()
 
     _run(_test())
+
+
+def test_wait_until_empty_wakes_on_last_unregister() -> None:
+    """Drain waiters resume as soon as the final client disconnects, without polling."""
+
+    async def _test() -> None:
+        """Run the async assertions for this test on a fresh event loop."""
+        bc = SseBroadcaster("test", max_clients=3, queue_size=4)
+        bc.bind_loop(asyncio.get_running_loop())
+        q1 = await bc.register()
+        q2 = await bc.register()
+        waiter = asyncio.create_task(bc.wait_until_empty())
+        await bc.unregister(q1)
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        await bc.unregister(q2)
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+    _run(_test())
+
+
+def test_stream_coalesces_queued_duplicates() -> None:
+    """Messages already queued are sent together in one chunk, each distinct one once."""
+
+    async def _test() -> None:
+        """Run the async assertions for this test on a fresh event loop."""
+        bc = SseBroadcaster("test", max_clients=3, queue_size=4)
+        bc.bind_loop(asyncio.get_running_loop())
+        q = await bc.register()
+        gen = cast(AsyncGenerator[str], bc.stream(q, heartbeat=5.0))
+        for message in ("a", "b", "a"):
+            bc.broadcast(message)
+        await asyncio.sleep(0)
+        frame = await asyncio.wait_for(gen.__anext__(), timeout=1.0)
+        assert frame == "data: a\n\ndata: b\n\n"
+        await gen.aclose()
+
+    _run(_test())
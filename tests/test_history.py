@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from backend.history import HistoryBuffer, item_diff_entries
+
 
 class TestGetHistory:
     """Tests for GET /api/v1/lists/{list_id}/history."""
@@ -49,6 +51,23 @@ class TestGetHistory:
         history = client.get(f"/api/v1/lists/{lst['id']}/history").json()
         assert all(h["item_text"] != "hidden item" for h in history)
 
+    def test_keyset_pages_cover_history_once(self, client, create_list, create_item) -> None:
+        """Paging with limit/before returns every entry once, in the unpaged order."""
+        lst = create_list()
+        for text in ("a", "b", "c", "d"):
+            create_item(lst["id"], text=text)
+        url = f"/api/v1/lists/{lst['id']}/history"
+        full = client.get(url).json()
+
+        paged: list[dict[str, Any]] = client.get(url, params={"limit": 2}).json()
+        while True:
+            page = client.get(url, params={"limit": 2, "before": paged[-1]["id"]}).json()
+            if not page:
+                break
+            paged.extend(page)
+        assert len(full) == 5
+        assert paged == full
+
 
 def _push_item(client, item_state, assumed) -> Any:
     """Push a single item change through the sync endpoint and return the response."""
@@ -112,6 +131,43 @@ class TestPartialPushHistory:
         assert "item_renamed" not in actions
 
 
+class TestItemDiffEntries:
+    """Tests for the pure ``item_diff_entries`` diff builder."""
+
+    def test_combined_edit_yields_one_entry_per_change(self) -> None:
+        """A rename plus completion in one write produces both entries, in order."""
+        old = {"id": "i1", "list_id": "l1", "text": "a", "completed": 0, "category_id": None}
+        new = {**old, "text": "b", "completed": 1}
+        assert item_diff_entries(old, new) == [
+            ("l1", "i1", "item_renamed", "a → b"),
+            ("l1", "i1", "item_completed", "b"),
+        ]
+
+    def test_undo_yields_no_entries(self) -> None:
+        """Undo writes never produce history entries."""
+        old = {"id": "i1", "list_id": "l1", "text": "a", "completed": 0}
+        assert item_diff_entries(old, {**old, "completed": 1}, undo=True) == []
+
+
+class TestHistoryBuffer:
+    """Tests for ``HistoryBuffer``."""
+
+    def test_flush_writes_queued_entries_once(self, db, create_list) -> None:
+        """Queued entries land on flush, and a second flush writes nothing new."""
+        lst = create_list()
+        buffer = HistoryBuffer()
+        buffer.extend([(lst["id"], None, "list_renamed", "a → b")])
+        buffer.extend([(lst["id"], None, "list_icon_changed", "x → y")])
+        cursor = db.cursor()
+        buffer.flush(cursor)
+        buffer.flush(cursor)
+        rows = db.execute(
+            "SELECT action FROM history WHERE list_id = ? AND action != 'list_created' ORDER BY id",
+            (lst["id"],),
+        ).fetchall()
+        assert [row["action"] for row in rows] == ["list_renamed", "list_icon_changed"]
+
+
 class TestHideItemHistory:
     """Tests for POST /api/v1/lists/{list_id}/history/hide."""
 
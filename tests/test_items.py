@@ -205,6 +205,23 @@ class TestUpdateItem:
         assert resp.status_code == 404
         assert resp.json()["error"]["code"] == "ITEM_NOT_FOUND"
 
+    def test_complete_not_found(self, client) -> None:
+        """The completion-only path still distinguishes a missing item from a no-op."""
+        resp = client.put(
+            "/api/v1/items/00000000-0000-0000-0000-000000000000",
+            json={"completed": True},
+        )
+        assert resp.status_code == 404
+        assert resp.json()["error"]["code"] == "ITEM_NOT_FOUND"
+
+    def test_complete_deleted_item_not_found(self, client, create_list, create_item) -> None:
+        """Completing a soft-deleted item is rejected rather than resurrecting its state."""
+        lst = create_list()
+        item = create_item(lst["id"])
+        client.delete(f"/api/v1/items/{item['id']}")
+        resp = client.put(f"/api/v1/items/{item['id']}", json={"completed": True})
+        assert resp.status_code == 404
+
 
 class TestDeleteItem:
     """Tests for DELETE /api/v1/items/{item_id}."""
@@ -228,6 +245,23 @@ class TestDeleteItem:
         ).fetchone()
         assert row["cnt"] == 0
 
+    def test_delete_twice_leaves_tombstone_untouched(
+        self, client, create_list, create_item, db
+    ) -> None:
+        """A repeated delete neither re-stamps the tombstone nor logs a second entry."""
+        lst = create_list()
+        item = create_item(lst["id"])
+        client.delete(f"/api/v1/items/{item['id']}")
+        first = db.execute("SELECT updated_at FROM items WHERE id = ?", (item["id"],)).fetchone()
+        client.delete(f"/api/v1/items/{item['id']}")
+        second = db.execute("SELECT updated_at FROM items WHERE id = ?", (item["id"],)).fetchone()
+        assert second["updated_at"] == first["updated_at"]
+        row = db.execute(
+            "SELECT COUNT(*) as cnt FROM history WHERE item_id = ? AND action = 'item_deleted'",
+            (item["id"],),
+        ).fetchone()
+        assert row["cnt"] == 1
+
     def test_delete_nonexistent_item_skips_broadcast(self, client, monkeypatch) -> None:
         """Deleting an absent item succeeds idempotently without scheduling any broadcast."""
         calls: list[tuple] = []
@@ -57,6 +57,14 @@ class TestCreateList:
         resp = client.post("/api/v1/lists", json={"name": "Work", "icon": "briefcase"})
         assert resp.json()["icon"] == "briefcase"
 
+    def test_create_list_appends_sort_order(self, client, db) -> None:
+        """New lists take the next sort_order slot, matching what is stored."""
+        first = client.post("/api/v1/lists", json={"name": "A"}).json()
+        second = client.post("/api/v1/lists", json={"name": "B"}).json()
+        assert second["sort_order"] == first["sort_order"] + 1
+        row = db.execute("SELECT sort_order FROM lists WHERE id = ?", (second["id"],)).fetchone()
+        assert row["sort_order"] == second["sort_order"]
+
     def test_create_list_undo_skips_history(self, client, db) -> None:
         """Creating with undo=True produces no history entry."""
         resp = client.post("/api/v1/lists", json={"name": "Undo List", "undo": True})
@@ -131,12 +139,25 @@ class TestUpdateList:
         updated = next(entry for entry in lists if entry["id"] == lst["id"])
         assert updated["item_sort"] == "created_desc"
 
+    def test_update_list_null_field_is_left_untouched(self, client, create_list) -> None:
+        """An explicit null is treated like an omitted field, not written as NULL."""
+        lst = create_list(name="Keep")
+        client.put(f"/api/v1/lists/{lst['id']}", json={"name": None, "icon": "star"})
+
+        lists = client.get("/api/v1/lists").json()
+        updated = next(entry for entry in lists if entry["id"] == lst["id"])
+        assert updated["name"] == "Keep"
+        assert updated["icon"] == "star"
+
     def test_update_list_invalid_sort(self, client, create_list) -> None:
         """Invalid item_sort returns 400 INVALID_SORT_OPTION."""
         lst = create_list()
         resp = client.put(f"/api/v1/lists/{lst['id']}", json={"item_sort": "bogus"})
         assert resp.status_code == 400
         assert resp.json()["error"]["code"] == "INVALID_SORT_OPTION"
+        assert resp.json()["error"]["message"].endswith(
+            "alphabetical, alphabetical_desc, created_desc, created_asc"
+        )
 
 
 class TestDeleteList:
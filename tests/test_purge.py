@@ -309,30 +309,23 @@ class TestHistoryItemFkMigration:
         )
         conn.commit()
 
-        class _CommitFails:
-            """Delegate to the real connection but raise on commit."""
+        def _deny_rename(action: int, *_: str | None) -> int:
+            """Fail the final ALTER ... RENAME so the rebuild aborts midway."""
+            if action == sqlite3.SQLITE_ALTER_TABLE:
+                return sqlite3.SQLITE_DENY
+            return sqlite3.SQLITE_OK
 
-            def __init__(self, real: sqlite3.Connection) -> None:
-                """Wrap the real connection that every call delegates to."""
-                self._real = real
-
-            def cursor(self) -> sqlite3.Cursor:
-                """Delegate cursor creation to the real connection."""
-                return self._real.cursor()
-
-            def commit(self) -> None:
-                """Simulate a commit failure to trigger the rollback path."""
-                raise sqlite3.OperationalError("simulated failure")
-
-            def rollback(self) -> None:
-                """Delegate rollback to the real connection."""
-                self._real.rollback()
-
-        with pytest.raises(sqlite3.OperationalError):
-            _ensure_history_item_fk(_CommitFails(conn))  # type: ignore[arg-type]
+        conn.set_authorizer(_deny_rename)
+        with pytest.raises(sqlite3.DatabaseError):
+            _ensure_history_item_fk(conn)
+        conn.set_authorizer(None)
 
         # Rollback restored the original (FK-less) table and its row.
         assert not self._has_item_fk(conn)
+        leftover = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'history_new'"
+        ).fetchone()
+        assert leftover is None
         row = conn.execute("SELECT item_id, item_text FROM history").fetchone()
         assert row == ("item-1", "Buy milk")
         conn.close()
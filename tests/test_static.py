@@ -1,5 +1,6 @@
 """Tests for static file endpoints and icon index caching."""
 
+import os
 from pathlib import Path
 
 from backend.routes import static as static_module
@@ -68,3 +69,40 @@ class TestIconIndex:
         assert resp.text == "<svg/>"
 
         static_module._icon_index.cache_clear()
+
+
+class TestShellAssets:
+    """Tests for the in-memory cache behind /, /manifest.json, /sw.js and friends."""
+
+    def test_sw_is_served_from_memory_with_etag(self, client, tmp_path, monkeypatch) -> None:
+        """The script body and ETag are served, and a matching If-None-Match gets a 304."""
+        (tmp_path / "sw.js").write_text("self.skipWaiting();")
+        monkeypatch.setattr(static_module, "DIST_DIR", tmp_path)
+        monkeypatch.setattr(static_module, "_shell_assets", {})
+
+        resp = client.get("/sw.js")
+        assert resp.status_code == 200
+        assert resp.text == "self.skipWaiting();"
+        assert resp.headers["content-type"].startswith("application/javascript")
+        assert resp.headers["cache-control"] == "no-cache, no-store, must-revalidate"
+
+        etag = resp.headers["etag"]
+        cached = client.get("/sw.js", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+    def test_changed_file_is_reloaded(self, client, tmp_path, monkeypatch) -> None:
+        """A rebuilt manifest (new mtime) is picked up without a restart."""
+        target = tmp_path / "manifest.json"
+        target.write_text('{"name": "old"}')
+        monkeypatch.setattr(static_module, "DIST_DIR", tmp_path)
+        monkeypatch.setattr(static_module, "_shell_assets", {})
+        first = client.get("/manifest.json")
+        assert first.json() == {"name": "old"}
+
+        target.write_text('{"name": "new"}')
+        stat = target.stat()
+        os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = client.get("/manifest.json")
+        assert second.json() == {"name": "new"}
+        assert second.headers["etag"] != first.headers["etag"]
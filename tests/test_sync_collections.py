@@ -32,6 +32,13 @@ def test_spec_sql_matches_table(collection) -> None:
     assert spec.update_sql.count("?") == len(spec.update_fields) + 1  # +1 for WHERE id=?
 
 
+def test_spec_sql_is_built_once() -> None:
+    """Repeated access returns the same cached string rather than rebuilding it."""
+    spec = COLLECTIONS["items"]
+    assert spec.update_sql is spec.update_sql
+    assert spec.pull_sql_checkpoint is spec.pull_sql_checkpoint
+
+
 def test_require_spec_rejects_unknown_collection() -> None:
     """Unknown collection names raise an AppError with 400 status."""
     from backend.errors import AppError, ErrorCode
@@ -76,6 +83,19 @@ def test_insert_and_select_item_via_spec(db, create_list) -> None:
     assert row["completed_at"] is None
 
 
+def test_select_doc_keys_plain_tuple_rows(db) -> None:
+    """_select_doc returns a dict even from a cursor without a row factory."""
+    spec = COLLECTIONS["lists"]
+    doc_id = _uuid()
+    cursor = db.cursor()
+    cursor.row_factory = None
+
+    _insert_doc(cursor, spec, {"id": doc_id, "name": "Tuples"})
+    row = _select_doc(cursor, spec, doc_id)
+    assert type(row) is dict
+    assert row["name"] == "Tuples"
+
+
 def test_update_doc_rewrites_fields(db) -> None:
     """_update_doc overwrites update_fields and keys by id."""
     spec = COLLECTIONS["lists"]
@@ -103,7 +123,7 @@ def test_pull_docs_without_checkpoint_respects_limit(db) -> None:
         _insert_doc(cursor, spec, {"id": _uuid(), "name": f"L{i}"})
     db.commit()
 
-    rows = _pull_docs(cursor, spec, updated_at=None, id=None, limit=2)
+    rows = _pull_docs(db, spec, updated_at=None, id=None, limit=2)
     assert len(rows) == 2
 
 